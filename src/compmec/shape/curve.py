@@ -13,10 +13,14 @@ from compmec.shape.polygon import Box, Point2D
 
 class Math:
     __caract_matrix = {}
+    __caract_matrix_f64 = {}
+    __binoms = {}
 
     @staticmethod
     def comb(n: int, i: int) -> int:
         """Computes binom(n, i)"""
+        if hasattr(math, "comb"):  # python >= 3.8
+            return math.comb(n, i)
         value = 1
         for j in range(n - i + 1, n + 1):
             value *= j
@@ -37,6 +41,26 @@ class Math:
             value += coef
         return value
 
+    @staticmethod
+    def bernstein_batch(degree: int, nodes: Tuple[float]) -> np.ndarray:
+        """Computes the bernstein polynomials for many nodes at once
+
+        B_{i,p}(u) = binom(p, i) * (1-u)^{p-i} * u^i
+
+        The result has shape (len(nodes), degree + 1)
+        """
+        if degree not in Math.__binoms:
+            binoms = tuple(Math.comb(degree, i) for i in range(degree + 1))
+            binoms = np.array(binoms, dtype="float64")
+            binoms.setflags(write=False)
+            Math.__binoms[degree] = binoms
+        nodes = np.asarray(nodes, dtype="float64").reshape(-1, 1)
+        expoents = np.arange(degree + 1)
+        values = np.power(nodes, expoents)
+        values *= np.power(1 - nodes, expoents[::-1])
+        values *= Math.__binoms[degree]
+        return values
+
     @staticmethod
     def bezier_caract_matrix(degree: int) -> Tuple[Tuple[int]]:
         """Returns the matrix [M] with the polynomial coefficients
@@ -52,15 +76,35 @@ class Math:
         assert isinstance(degree, int)
         assert degree >= 0
         if degree not in Math.__caract_matrix:
-            matrix = np.zeros((degree + 1, degree + 1), dtype="object")
+            # Pascal's triangle: binoms[n][k] = binom(n, k)
+            binoms = [[1]]
+            for n in range(1, degree + 1):
+                line = [1] * (n + 1)
+                for k in range(1, n):
+                    line[k] = binoms[n - 1][k - 1] + binoms[n - 1][k]
+                binoms.append(line)
+            matrix = [[0] * (degree + 1) for _ in range(degree + 1)]
             for i in range(degree + 1):
                 for j in range(degree - i + 1):
-                    val = Math.comb(degree, i) * Math.comb(degree - i, j)
-                    matrix[i, j] = -val if (degree + i + j) % 2 else val
+                    val = binoms[degree][i] * binoms[degree - i][j]
+                    matrix[i][j] = -val if (degree + i + j) % 2 else val
             matrix = tuple(tuple(line) for line in matrix)
             Math.__caract_matrix[degree] = matrix
         return Math.__caract_matrix[degree]
 
+    @staticmethod
+    def bezier_caract_matrix_f64(degree: int) -> np.ndarray:
+        """Returns the matrix of ``bezier_caract_matrix`` as float64
+
+        The array is read-only, since it's shared by all the curves
+        """
+        if degree not in Math.__caract_matrix_f64:
+            matrix = Math.bezier_caract_matrix(degree)
+            matrix = np.array(matrix, dtype="float64")
+            matrix.setflags(write=False)
+            Math.__caract_matrix_f64[degree] = matrix
+        return Math.__caract_matrix_f64[degree]
+
     @staticmethod
     def closed_linspace(npts: int) -> Tuple[Fraction]:
         assert isinstance(npts, int)
@@ -120,6 +164,26 @@ class BezierCurve(BaseCurve):
     @ctrlpoints.setter
     def ctrlpoints(self, other: Tuple[Any]):
         self.__ctrlpoints = tuple(other)
+        self.__isfloat = None
+        self.__array = None
+        self.__canon = None
+
+    @property
+    def array(self) -> np.ndarray:
+        """The control points as a float64 array
+
+        Built once and kept until the control points are set again
+
+        :getter: Returns the array of shape (npts, ) or (npts, 2)
+        :type: numpy.ndarray
+        """
+        if self.__array is None:
+            values = tuple(
+                tuple(point) if isinstance(point, Point2D) else point
+                for point in self.ctrlpoints
+            )
+            self.__array = np.array(values, dtype="float64")
+        return self.__array
 
     def __str__(self) -> str:
         msg = f"BezierCurve of degree {self.degree} and "
@@ -139,20 +203,65 @@ class BezierCurve(BaseCurve):
 
         """
         iter(nodes)
-        results = [0] * len(nodes)
-        matrix = Math.bezier_caract_matrix(self.degree)
-        canon_pts = np.dot(self.ctrlpoints, matrix)
-        for k, node in enumerate(nodes):
-            results[k] = Math.horner_method(node, canon_pts)
-        return tuple(results)
+        points = self.__float_points()
+        if points is None and all(isinstance(node, float) for node in nodes):
+            points = self.array  # Float nodes give float values anyway
+        if points is None:  # Exact arithmetic, like Fraction
+            results = [0] * len(nodes)
+            if self.__canon is None:
+                matrix = Math.bezier_caract_matrix(self.degree)
+                self.__canon = np.dot(self.ctrlpoints, matrix)
+            canon_pts = self.__canon
+            for k, node in enumerate(nodes):
+                results[k] = Math.horner_method(node, canon_pts)
+            return tuple(results)
+        values = self.eval_array(nodes)
+        if points.ndim == 1:
+            return tuple(values.tolist())
+        return tuple(Point2D(xval, yval) for xval, yval in values.tolist())
+
+    def eval_array(self, nodes: Tuple[float]) -> np.ndarray:
+        """Evaluates the curve using float64 arithmetic
+
+        Works with any kind of control points, converting them to float.
+        The result has shape (len(nodes), ) + self.array.shape[1:]
+        """
+        bernstein = Math.bernstein_batch(self.degree, nodes)
+        return np.dot(bernstein, self.array)
+
+    def __float_points(self) -> Union[np.ndarray, None]:
+        """Gives the control points as a float64 array
+
+        Returns None if any coordinate is not a float, like
+        an integer or a Fraction, to keep the exact arithmetic
+        """
+        if self.__isfloat is None:
+            self.__isfloat = True
+            for point in self.ctrlpoints:
+                coords = (
+                    tuple(point) if isinstance(point, Point2D) else (point,)
+                )
+                if not all(isinstance(value, float) for value in coords):
+                    self.__isfloat = False
+                    break
+        return self.array if self.__isfloat else None
 
     def derivate(self, times: Optional[int] = 1) -> BezierCurve:
         assert isinstance(times, int)
         assert times > 0
-        matrix = Derivate.non_rational_bezier(self.degree, times)
-        new_ctrlpoints = np.dot(matrix, self.ctrlpoints)
+        points = self.__float_points()
+        if points is None:
+            matrix = Derivate.non_rational_bezier(self.degree, times)
+            new_ctrlpoints = np.dot(matrix, self.ctrlpoints)
+        else:
+            matrix = Derivate.non_rational_bezier_f64(self.degree, times)
+            new_ctrlpoints = np.dot(matrix, points).tolist()
         return self.__class__(new_ctrlpoints)
 
+    def isfloat(self) -> bool:
+        """Tells if all the control points have only float coordinates"""
+        return self.__float_points() is not None
+
     def clean(self, tolerance: Optional[float] = 1e-9) -> BezierCurve:
         """Reduces at maximum the degree of the bezier curve.
 
@@ -160,6 +269,9 @@ class BezierCurve(BaseCurve):
         and stops with a bezier curve of degree ``1`` (segment)
 
         """
+        points = self.__float_points()
+        if points is not None:
+            return self.__clean_float(points, tolerance)
         degree = self.degree
         times = 0
         points = self.ctrlpoints
@@ -175,6 +287,27 @@ class BezierCurve(BaseCurve):
         self.ctrlpoints = tuple(np.dot(mattrans, points))
         return self
 
+    def __clean_float(
+        self, points: np.ndarray, tolerance: Union[float, None]
+    ) -> BezierCurve:
+        """Same as ``clean``, but using float64 arithmetic"""
+        degree = self.degree
+        times = 0
+        while degree - times > 1:
+            _, materror = Operations.degree_decrease_f64(degree, times + 1)
+            error = np.sum(points * np.dot(materror, points))
+            if tolerance and error > tolerance:
+                break
+            times += 1
+        if times == 0:
+            return
+        mattrans, _ = Operations.degree_decrease_f64(degree, times)
+        values = np.dot(mattrans, points).tolist()
+        if points.ndim != 1:
+            values = (Point2D(xval, yval) for xval, yval in values)
+        self.ctrlpoints = tuple(values)
+        return self
+
     def split(self, nodes: Tuple[float]) -> Tuple[BezierCurve]:
         knotvector = nurbs.GeneratorKnotVector.bezier(self.degree)
         curve = nurbs.Curve(knotvector, self.ctrlpoints)
@@ -185,10 +318,23 @@ class BezierCurve(BaseCurve):
 
 class PlanarCurve(BaseCurve):
     def __init__(self, ctrlpoints: Tuple[Point2D]):
-        ctrlpoints = list(ctrlpoints)
-        for i, point in enumerate(ctrlpoints):
-            ctrlpoints[i] = Point2D(point)
-        self.__planar = BezierCurve(ctrlpoints)
+        self.__planar = BezierCurve(self.__to_points(ctrlpoints))
+        self.__derivates = {}
+        self.__box = None
+
+    @staticmethod
+    def __to_points(ctrlpoints: Tuple[Any]) -> Tuple[Point2D]:
+        """Converts the given control points into Point2D instances
+
+        The points which are already Point2D are kept, not copied
+        """
+        if isinstance(ctrlpoints, np.ndarray):
+            if np.issubdtype(ctrlpoints.dtype, np.floating):
+                ctrlpoints = ctrlpoints.tolist()
+        return tuple(
+            point if isinstance(point, Point2D) else Point2D(point)
+            for point in ctrlpoints
+        )
 
     def __or__(self, other: PlanarCurve) -> PlanarCurve:
         """Computes the union of two bezier curves"""
@@ -235,25 +381,26 @@ class PlanarCurve(BaseCurve):
             return None
         if self == other:
             return tuple()
-        if self.degree == 1 and other.degree == 1:
-            params = Intersection.lines(self, other)
-            return (params,) if len(params) else tuple()
-        usample = list(Math.closed_linspace(self.npts + 3))
-        vsample = list(Math.closed_linspace(other.npts + 3))
-        pairs = []
-        for i, ui in enumerate(usample):
-            pairs += [(ui, vj) for vj in vsample]
+        pairs = Intersection.analytic_pairs(self, other)
+        if pairs is not None:
+            return pairs
+        isfloat = self.isfloat() and other.isfloat()
+        pairs = Intersection.sample_pairs(self, other)
+        tol_norm = 1e-6  # Tolerance of the distance of points
+        tol_du = 1e-6  # Tolerance of the distance abs(ui-uj, vi-vj)
+        corners = ((1, 1), (1, 0), (0, 1), (0, 0))
+        corners = Intersection.filter_distance(self, other, corners, tol_norm)
         for k in range(3):
-            pairs = Intersection.bezier_and_bezier(self, other, pairs)
-            pairs.insert(0, (0, 0))
-            pairs.insert(0, (0, 1))
-            pairs.insert(0, (1, 0))
-            pairs.insert(0, (1, 1))
-            # Filter values by distance of points
-            tol_norm = 1e-6
-            pairs = Intersection.filter_distance(self, other, pairs, tol_norm)
-            # Filter values by distance abs(ui-uj, vi-vj)
-            tol_du = 1e-6
+            if isfloat:  # Distances come from the last newton's step
+                pairs = Intersection.bezier_and_bezier_float(
+                    self, other, pairs, tol_norm
+                )
+            else:
+                pairs = Intersection.bezier_and_bezier(self, other, pairs)
+                pairs = Intersection.filter_distance(
+                    self, other, pairs, tol_norm
+                )
+            pairs = corners + tuple(pairs)
             pairs = Intersection.filter_parameters(pairs, tol_du)
         return tuple(pairs)
 
@@ -305,30 +452,59 @@ class PlanarCurve(BaseCurve):
 
     @ctrlpoints.setter
     def ctrlpoints(self, points: Tuple[Point2D]):
-        points = list(points)
-        for i, point in enumerate(points):
-            points[i] = Point2D(point)
-        self.__planar.ctrlpoints = points
+        self.__planar.ctrlpoints = self.__to_points(points)
+        self.__derivates.clear()
+        self.__box = None
 
     def eval(self, nodes: Tuple[float]) -> Tuple[Any]:
         return self.__planar.eval(nodes)
 
+    def eval_xy(self, nodes: Tuple[float]) -> np.ndarray:
+        """Evaluates the curve using float64 arithmetic
+
+        Returns an array of shape (len(nodes), 2)
+        """
+        return self.__planar.eval_array(nodes)
+
+    def isfloat(self) -> bool:
+        """Tells if all the control points have only float coordinates"""
+        return self.__planar.isfloat()
+
     def derivate(self, times: Optional[int] = 1) -> PlanarCurve:
         assert isinstance(times, int)
         assert times > 0
-        matrix = Derivate.non_rational_bezier(self.degree, times)
-        new_ctrlpoints = np.dot(matrix, self.ctrlpoints)
-        return self.__class__(new_ctrlpoints)
+        if times not in self.__derivates:
+            new_bezier = self.__planar.derivate(times)
+            self.__derivates[times] = self.__class__(new_bezier.ctrlpoints)
+        return self.__derivates[times]
+
+    @property
+    def xy(self) -> np.ndarray:
+        """Control points as a float64 array of shape (npts, 2)
+
+        :getter: Returns the stored array, not a copy
+        :type: numpy.ndarray
+        """
+        return self.__planar.array
 
     def box(self) -> Box:
         """Returns two points which defines the minimal exterior rectangle
 
         Returns the pair (A, B) with A[0] <= B[0] and A[1] <= B[1]
         """
-        xmin = min(point[0] for point in self.ctrlpoints)
-        xmax = max(point[0] for point in self.ctrlpoints)
-        ymin = min(point[1] for point in self.ctrlpoints)
-        ymax = max(point[1] for point in self.ctrlpoints)
+        if self.__box is None:
+            self.__box = self.__compute_box()
+        return self.__box
+
+    def __compute_box(self) -> Box:
+        """Private method of ``box``, computes it from control points"""
+        if self.isfloat():
+            xmin, ymin = np.min(self.xy, axis=0).tolist()
+            xmax, ymax = np.max(self.xy, axis=0).tolist()
+            return Box(Point2D(xmin, ymin), Point2D(xmax, ymax))
+        xvals, yvals = zip(*self.ctrlpoints)
+        xmin, xmax = min(xvals), max(xvals)
+        ymin, ymax = min(yvals), max(yvals)
         return Box(Point2D(xmin, ymin), Point2D(xmax, ymax))
 
     def clean(self, tolerance: Optional[float] = 1e-9) -> PlanarCurve:
@@ -339,6 +515,8 @@ class PlanarCurve(BaseCurve):
 
         """
         self.__planar.clean(tolerance)
+        self.__derivates.clear()
+        self.__box = None
         return self
 
     def __copy__(self) -> PlanarCurve:
@@ -353,6 +531,8 @@ class PlanarCurve(BaseCurve):
         npts = len(points)
         new_ctrlpoints = tuple(points[i] for i in range(npts - 1, -1, -1))
         self.__planar.ctrlpoints = new_ctrlpoints
+        self.__derivates.clear()
+        self.__box = None
         return self
 
     def split(self, nodes: Tuple[float]) -> Tuple[PlanarCurve]:
@@ -363,6 +543,7 @@ class PlanarCurve(BaseCurve):
 
 class Operations:
     __degree_decre = {}
+    __degree_decre_f64 = {}
 
     @staticmethod
     def degree_decrease(degree: int, times: int) -> Tuple[Tuple[Tuple[float]]]:
@@ -393,11 +574,28 @@ class Operations:
             Operations.__degree_decre[(degree, times)] = matrix, error
         return Operations.__degree_decre[(degree, times)]
 
+    @staticmethod
+    def degree_decrease_f64(degree: int, times: int) -> Tuple[np.ndarray]:
+        """Returns the matrices of ``degree_decrease`` as float64
+
+        The arrays are read-only, since they are shared by all the curves
+        """
+        if (degree, times) not in Operations.__degree_decre_f64:
+            matrices = Operations.degree_decrease(degree, times)
+            matrices = tuple(
+                np.array(mat, dtype="float64") for mat in matrices
+            )
+            for matrix in matrices:
+                matrix.setflags(write=False)
+            Operations.__degree_decre_f64[(degree, times)] = matrices
+        return Operations.__degree_decre_f64[(degree, times)]
+
 
 class Intersection:
     tol_du = 1e-9  # tolerance convergence
     tol_norm = 1e-9  # tolerance convergence
     max_denom = math.ceil(1 / tol_du)
+    max_implicit = 3  # Maximal degree to use implicitization
 
     @staticmethod
     def lines(curvea: PlanarCurve, curveb: PlanarCurve) -> Tuple[float]:
@@ -423,6 +621,217 @@ class Intersection:
             return tuple()  # Parallel, but not colinear
         return tuple()
 
+    @staticmethod
+    def analytic_pairs(
+        curvea: PlanarCurve, curveb: PlanarCurve
+    ) -> Union[None, Tuple[Tuple[float]]]:
+        """Finds all the pairs (u*, v*) such A(u*) = B(v*) without
+        iterations, when both curves are segments or when the curves
+        have float coordinates and one of them is a segment or has a
+        degree small enough to use its implicit form
+
+        Returns None if there's no analytic way to find them
+        """
+        if curvea.degree == 1 and curveb.degree == 1:
+            params = Intersection.lines(curvea, curveb)
+            return (params,) if len(params) else tuple()
+        tolerance = Intersection.tol_norm
+        if all(
+            Intersection.linearization_error(curve) < tolerance
+            for curve in (curvea, curveb)
+        ):
+            linea = curvea.__class__(curvea.ctrlpoints[:: curvea.degree])
+            lineb = curveb.__class__(curveb.ctrlpoints[:: curveb.degree])
+            params = Intersection.lines(linea, lineb)
+            return (params,) if len(params) else tuple()
+        if not (curvea.isfloat() and curveb.isfloat()):
+            return None
+        swap = curvea.degree != 1 and (
+            curveb.degree == 1 or curvea.degree > Intersection.max_implicit
+        )
+        if swap:
+            pairs = Intersection.__float_pairs(curveb, curvea)
+            if pairs is not None:
+                pairs = tuple((ui, vi) for vi, ui in pairs)
+        else:
+            pairs = Intersection.__float_pairs(curvea, curveb)
+        if pairs is None:
+            return None
+        pairs = Intersection.filter_distance(curvea, curveb, pairs, 1e-6)
+        return Intersection.filter_parameters(pairs, 1e-6)
+
+    @staticmethod
+    def __float_pairs(
+        curvea: PlanarCurve, curveb: PlanarCurve
+    ) -> Union[None, Tuple[Tuple[float]]]:
+        """Solves A(u) = B(v) when A is a segment or has a small degree,
+        such its implicit form can be used"""
+        if curvea.degree == 1:
+            return Intersection.line_and_bezier(curvea, curveb)
+        if curvea.degree <= Intersection.max_implicit:
+            return Intersection.implicit_and_bezier(curvea, curveb)
+        return None
+
+    @staticmethod
+    def sample_pairs(
+        curvea: PlanarCurve, curveb: PlanarCurve
+    ) -> Union[np.ndarray, Tuple[Tuple[float]]]:
+        """Gives the grid of pairs (u, v) which starts newton's method
+
+        Float curves give a float64 array of shape (n, 2), while other
+        curves give a list of pairs of Fractions, to keep exact values
+        """
+        if curvea.isfloat() and curveb.isfloat():
+            usample = np.linspace(0, 1, curvea.npts + 3)
+            vsample = np.linspace(0, 1, curveb.npts + 3)
+            pairs = np.stack(np.meshgrid(usample, vsample, indexing="ij"))
+            return pairs.reshape(2, -1).T
+        usample = Math.closed_linspace(curvea.npts + 3)
+        vsample = Math.closed_linspace(curveb.npts + 3)
+        return [(ui, vj) for ui in usample for vj in vsample]
+
+    @staticmethod
+    def linearization_error(curve: PlanarCurve) -> float:
+        """Gives the maximal distance between the control points and
+        the points of the segment that links the extremities
+
+        error = max_i abs(P_i - lerp(P_0, P_p, i/p))
+
+        If it's zero, the curve is a segment with linear parametrization
+        """
+        degree = curve.degree
+        if degree < 2:
+            return 0
+        start, end = curve.ctrlpoints[0], curve.ctrlpoints[-1]
+        vector = end - start
+        errors = (
+            abs(point - start - Fraction(i, degree) * vector)
+            for i, point in enumerate(curve.ctrlpoints[1:-1], start=1)
+        )
+        return max(errors)
+
+    @staticmethod
+    def line_and_bezier(
+        line: PlanarCurve, curve: PlanarCurve
+    ) -> Union[None, Tuple[Tuple[float]]]:
+        """Finds all the pairs (u*, v*) such L(u*) = B(v*)
+
+        L is a segment (degree 1) and B is a bezier curve of any degree,
+        both with float coordinates. With the normal vector n of L
+
+        n * (B(v) - L(0)) = 0
+
+        is a polynomial equation on v, solved by its roots.
+        Returns None if the polynomial is null: B is over the line of L
+        """
+        start, end = line.xy
+        vector = end - start
+        normal = np.array((-vector[1], vector[0]))
+        matrix = Math.bezier_caract_matrix_f64(curve.degree)
+        poly = np.dot(np.dot(matrix.T, curve.xy), normal)
+        poly[-1] -= np.dot(normal, start)
+        if np.all(np.abs(poly) < Intersection.tol_norm):
+            return None
+        roots = np.roots(poly)
+        roots = np.real(roots[np.abs(np.imag(roots)) < 1e-6])
+        dpoly = np.polyder(poly)
+        for _ in range(2):  # Polish the roots with newton's iteration
+            dvals = np.polyval(dpoly, roots)
+            dvals = np.where(np.abs(dvals) > 1e-9, dvals, 1)
+            roots = roots - np.polyval(poly, roots) / dvals
+        tolerance = Intersection.tol_du
+        roots = roots[(-tolerance <= roots) & (roots <= 1 + tolerance)]
+        vparams = np.clip(roots, 0, 1)
+        diffs = curve.eval_xy(vparams) - start
+        uparams = np.dot(diffs, vector) / np.dot(vector, vector)
+        mask = (-tolerance <= uparams) & (uparams <= 1 + tolerance)
+        uparams = np.clip(uparams[mask], 0, 1)
+        vparams = vparams[mask]
+        return tuple(zip(uparams.tolist(), vparams.tolist()))
+
+    @staticmethod
+    def bezout_matrix(xcoefs: np.ndarray, ycoefs: np.ndarray) -> np.ndarray:
+        """Gives the bezout matrix of the polynomials X(u) and Y(u)
+
+        The coefficients are [a0, a1, ..., ap] and can have a last
+        dimension, to compute many matrices at once: (p+1, n) -> (n, p, p)
+
+        (X(u) * Y(w) - X(w) * Y(u)) / (u - w) = sum_ij B_ij * u^i * w^j
+
+        The curve A(u) = (x(u), y(u)) passes by the point P if, and
+        only if, the matrix of X = x - P.x and Y = y - P.y is singular
+        """
+        degree = len(xcoefs) - 1
+        shape = (degree, degree) + xcoefs.shape[1:]
+        matrix = np.zeros(shape, dtype="float64")
+        for i in range(degree):
+            for j in range(degree):
+                for k in range(min(i, degree - 1 - j) + 1):
+                    matrix[i, j] += xcoefs[j + k + 1] * ycoefs[i - k]
+                    matrix[i, j] -= xcoefs[i - k] * ycoefs[j + k + 1]
+        return np.moveaxis(matrix, (0, 1), (-2, -1))
+
+    @staticmethod
+    def implicit_and_bezier(
+        curvea: PlanarCurve, curveb: PlanarCurve
+    ) -> Union[None, Tuple[Tuple[float]]]:
+        """Finds all the pairs (u*, v*) such A(u*) = B(v*)
+
+        A is a bezier curve of degree 2 or 3 and B is a bezier curve of
+        any degree, both with float coordinates. The implicit form of A
+
+        f(x, y) = det(bezout_matrix(x(u) - x, y(u) - y)) = 0
+
+        is composed with B(v), giving a polynomial on v of degree
+        degree(A) * degree(B), interpolated on chebyshev nodes and
+        solved by its roots. Each u* is found by projecting B(v*) on A.
+        Returns None if the implicit form is badly conditioned, or
+        if the polynomial is null: B is over the curve A
+        """
+        lowpt, toppt = np.min(curvea.xy, axis=0), np.max(curvea.xy, axis=0)
+        center, scale = (lowpt + toppt) / 2, np.max(toppt - lowpt)
+        matrix = Math.bezier_caract_matrix_f64(curvea.degree)
+        coefsa = np.dot(matrix.T, (curvea.xy - center) / scale)[::-1]
+
+        def implicit(points: np.ndarray) -> np.ndarray:
+            xcoefs = np.tile(coefsa[:, :1], len(points))
+            ycoefs = np.tile(coefsa[:, 1:], len(points))
+            xcoefs[0] -= points[:, 0]
+            ycoefs[0] -= points[:, 1]
+            return np.linalg.det(Intersection.bezout_matrix(xcoefs, ycoefs))
+
+        def composed(nodes: np.ndarray) -> np.ndarray:
+            points = (curveb.eval_xy((nodes + 1) / 2) - center) / scale
+            return implicit(points)
+
+        angles = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+        circle = np.stack((np.cos(angles), np.sin(angles)), axis=1)
+        reference = np.max(np.abs(implicit(2 * circle)))
+        if reference < 1e-9:  # A is a degenerated curve, like a segment
+            return None
+        degree = curvea.degree * curveb.degree
+        poly = np.polynomial.chebyshev.chebinterpolate(composed, degree)
+        if np.all(np.abs(poly) < 1e-9 * reference):
+            return None
+        roots = np.polynomial.chebyshev.chebroots(poly)
+        roots = np.real(roots[np.abs(np.imag(roots)) < 1e-6])
+        dpoly = np.polynomial.chebyshev.chebder(poly)
+        for _ in range(2):  # Polish the roots with newton's iteration
+            dvals = np.polynomial.chebyshev.chebval(roots, dpoly)
+            dvals = np.where(np.abs(dvals) > 1e-9, dvals, 1)
+            roots = (
+                roots - np.polynomial.chebyshev.chebval(roots, poly) / dvals
+            )
+        tolerance = 2 * Intersection.tol_du
+        roots = roots[(-1 - tolerance <= roots) & (roots <= 1 + tolerance)]
+        vparams = np.clip((roots + 1) / 2, 0, 1)
+        pairs = []
+        vparams = tuple(vparams.tolist())
+        for vparam, point in zip(vparams, curveb.eval(vparams)):
+            uparams = Projection.point_on_curve(point, curvea)
+            pairs += [(uparam, vparam) for uparam in uparams]
+        return tuple(pairs)
+
     @staticmethod
     def bezier_and_bezier(
         curvea: PlanarCurve, curveb: PlanarCurve, pairs: Tuple[Tuple[float]]
@@ -431,6 +840,8 @@ class Intersection:
 
         Uses newton's method
         """
+        if curvea.isfloat() and curveb.isfloat():
+            return Intersection.bezier_and_bezier_float(curvea, curveb, pairs)
         dcurvea = curvea.derivate()
         ddcurvea = dcurvea.derivate()
         dcurveb = curveb.derivate()
@@ -469,6 +880,74 @@ class Intersection:
                 pairs[i] = (ui, vi)
         return pairs
 
+    @staticmethod
+    def bezier_and_bezier_float(
+        curvea: PlanarCurve,
+        curveb: PlanarCurve,
+        pairs: Tuple[Tuple[float]],
+        max_dist: Optional[float] = None,
+    ) -> Tuple[Tuple[float]]:
+        """Same as ``bezier_and_bezier``, but using float64 arithmetic
+
+        All the pairs (u, v) are updated at once, in arrays.
+        If ``max_dist`` is given, only the pairs such
+        abs(A(u*) - B(v*)) < max_dist are returned
+        """
+        dcurvea = curvea.derivate()
+        dcurveb = curveb.derivate()
+        curves = (curvea, dcurvea, dcurvea.derivate())
+        curves += (curveb, dcurveb, dcurveb.derivate())
+        coefs = []
+        for curve in curves:
+            matrix = Math.bezier_caract_matrix_f64(curve.degree)
+            coefs.append(np.dot(matrix.T, curve.xy)[::-1])
+        pairs = np.array(pairs, dtype="float64").reshape(-1, 2)
+        pairs, distances = Intersection.newton_kernel(coefs, pairs)
+        if max_dist is not None:
+            pairs = pairs[distances < max_dist]
+        pairs = np.unique(pairs, axis=0)
+        return [tuple(pair) for pair in pairs.tolist()]
+
+    @staticmethod
+    def newton_kernel(
+        coefs: Tuple[np.ndarray], pairs: np.ndarray, niter: int = 20
+    ) -> Tuple[np.ndarray]:
+        """Newton's iterations of ``bezier_and_bezier`` over float arrays
+
+        ``coefs`` are the polynomial coefficients [a0, a1, ..., ap] of
+        A, A', A'', B, B' and B'', each one of shape (p+1, 2),
+        while ``pairs`` has shape (n, 2).
+        Only one table of powers is built for each parameter, and the
+        pairs with singular jacobian are removed.
+        Returns the final pairs and the distances abs(A(u) - B(v)),
+        taken from the evaluation made after the last step
+        """
+        coefsa, dcoefsa, ddcoefsa, coefsb, dcoefsb, ddcoefsb = coefs
+        for k in range(niter + 1):
+            usample, vsample = pairs[:, 0], pairs[:, 1]
+            upowers = np.vander(usample, len(coefsa), increasing=True)
+            vpowers = np.vander(vsample, len(coefsb), increasing=True)
+            dif = np.dot(upowers, coefsa) - np.dot(vpowers, coefsb)
+            if k == niter:
+                break
+            dsu = np.dot(upowers[:, : len(dcoefsa)], dcoefsa)
+            ddu = np.dot(upowers[:, : len(ddcoefsa)], ddcoefsa)
+            dov = np.dot(vpowers[:, : len(dcoefsb)], dcoefsb)
+            ddv = np.dot(vpowers[:, : len(ddcoefsb)], ddcoefsb)
+            vect0 = np.sum(dsu * dif, axis=1)
+            vect1 = -np.sum(dov * dif, axis=1)
+            mat00 = np.sum(dsu * dsu + ddu * dif, axis=1)
+            mat01 = -np.sum(dsu * dov, axis=1)
+            mat11 = np.sum(dov * dov - ddv * dif, axis=1)
+            deter = mat00 * mat11 - mat01**2
+            valid = np.abs(deter) >= 1e-6
+            deter = np.where(valid, deter, 1)
+            usample = usample - (mat11 * vect0 - mat01 * vect1) / deter
+            vsample = vsample - (mat00 * vect1 - mat01 * vect0) / deter
+            pairs = np.stack((usample, vsample), axis=1)[valid]
+            pairs = np.clip(pairs, 0, 1)
+        return pairs, np.hypot(dif[:, 0], dif[:, 1])
+
     @staticmethod
     def filter_distance(
         curvea: PlanarCurve,
@@ -476,35 +955,39 @@ class Intersection:
         pairs: Tuple[Tuple[float]],
         max_dist: float,
     ) -> Tuple[Tuple[float]]:
-        pairs = list(pairs)
-        index = 0
-        while index < len(pairs):
-            ui, vi = pairs[index]
-            diff = curvea(ui) - curveb(vi)
-            if abs(diff) < max_dist:
-                index += 1
-            else:
-                pairs.pop(index)
-        return tuple(pairs)
+        pairs = tuple(pairs)
+        if len(pairs) == 0:
+            return pairs
+        params = np.array(pairs, dtype="float64")
+        diffs = curvea.eval_xy(params[:, 0]) - curveb.eval_xy(params[:, 1])
+        distances = np.hypot(diffs[:, 0], diffs[:, 1])
+        return tuple(
+            pair for pair, dist in zip(pairs, distances) if dist < max_dist
+        )
 
     @staticmethod
     def filter_parameters(
         pairs: Tuple[Tuple[float]], max_dist: float
     ) -> Tuple[Tuple[float]]:
-        pairs = list(pairs)
-        index = 0
-        while index < len(pairs):
-            ui, vi = pairs[index]
-            j = index + 1
-            while j < len(pairs):
-                uj, vj = pairs[j]
-                dist2 = (ui - uj) ** 2 + (vi - vj) ** 2
-                if dist2 < max_dist**2:
-                    pairs.pop(j)
-                else:
-                    j += 1
-            index += 1
-        return tuple(pairs)
+        # Keeps a pair if it's far from all the pairs kept before.
+        # The kept pairs are stored in a grid of cells of size max_dist,
+        # so only the 3x3 neighbor cells must be verified
+        cells = {}
+        filtered = []
+        for ui, vi in pairs:
+            celli, cellj = int(ui // max_dist), int(vi // max_dist)
+            neighbors = (
+                cells.get((celli + di, cellj + dj), ())
+                for di in (-1, 0, 1)
+                for dj in (-1, 0, 1)
+            )
+            for uj, vj in (pair for cell in neighbors for pair in cell):
+                if (ui - uj) ** 2 + (vi - vj) ** 2 < max_dist**2:
+                    break
+            else:
+                cells.setdefault((celli, cellj), []).append((ui, vi))
+                filtered.append((ui, vi))
+        return tuple(filtered)
 
 
 class Projection:
@@ -526,9 +1009,9 @@ class Projection:
         nsample = 2 + curve.degree
         usample = Math.closed_linspace(nsample)
         usample = Projection.newton_iteration(point, curve, usample)
-        curvals = tuple(cval - point for cval in curve(usample))
-        distans2 = tuple(curval.inner(curval) for curval in curvals)
-        mindist2 = min(distans2)
+        curvals = curve.eval_xy(usample) - np.array(tuple(point), "float64")
+        distans2 = np.sum(curvals * curvals, axis=1)
+        mindist2 = np.min(distans2)
         params = []
         for i, dist2 in enumerate(distans2):
             if abs(dist2 - mindist2) < 1e-6:  # Tolerance
@@ -543,32 +1026,29 @@ class Projection:
         Uses newton iterations to find the parameters ``usample``
         such <C'(u), C(u) - P> = 0 stabilizes
         """
-        point = Point2D(point)
+        point = np.array(tuple(Point2D(point)), dtype="float64")
         dcurve = curve.derivate()
         ddcurve = dcurve.derivate()
-        usample = list(usample)
-        zero, one = Fraction(0), Fraction(1)
+        usample = np.array(usample, dtype="float64")
         for _ in range(10):  # Number of iterations
-            curvals = tuple(cval - point for cval in curve(usample))
-            dcurvals = dcurve(usample)
-            ddcurvals = ddcurve(usample)
-            for k, uk in enumerate(usample):
-                curval = curvals[k]
-                deriva = dcurvals[k]
-                fuk = deriva.inner(curval)
-                dfuk = ddcurvals[k].inner(curval)
-                dfuk += deriva.inner(deriva)
-                dfuk = dfuk if abs(dfuk) > 1e-6 else 1e-6
-                newu = uk - fuk / dfuk
-                usample[k] = min(one, max(newu, zero))
-            usample = list(set(usample))
-            if len(usample) == 1:
+            curvals = curve.eval_xy(usample) - point
+            dcurvals = dcurve.eval_xy(usample)
+            fus = np.sum(dcurvals * curvals, axis=1)
+            if np.max(np.abs(fus)) < 1e-12:  # Converged
                 break
-        return usample
+            ddcurvals = ddcurve.eval_xy(usample)
+            dfus = np.sum(ddcurvals * curvals, axis=1)
+            dfus += np.sum(dcurvals * dcurvals, axis=1)
+            dfus = np.where(np.abs(dfus) > 1e-6, dfus, 1e-6)
+            usample = np.clip(usample - fus / dfus, 0, 1)
+        usample = np.unique(np.round(usample, 12))
+        return tuple(usample.tolist())
 
 
 class Derivate:
     __non_rat_bezier_once = {}
+    __non_rat_bezier = {}
+    __non_rat_bezier_f64 = {}
 
     @staticmethod
     def non_rational_bezier_once(degree: int) -> Tuple[Tuple[float]]:
@@ -586,11 +1066,13 @@ class Derivate:
         q = p - 1
         """
         if degree not in Derivate.__non_rat_bezier_once:
-            knotvector = nurbs.GeneratorKnotVector.bezier(degree, Fraction)
-            matrix = nurbs.heavy.Calculus.derivate_nonrational_bezier(
-                knotvector
-            )
-            Derivate.__non_rat_bezier_once[degree] = tuple(matrix)
+            # Q_i = p * (P_{i+1} - P_i)
+            matrix = np.zeros((degree, degree + 1), dtype="int64")
+            indexs = np.arange(degree)
+            matrix[indexs, indexs] = -degree
+            matrix[indexs, indexs + 1] = degree
+            matrix = tuple(map(tuple, matrix.tolist()))
+            Derivate.__non_rat_bezier_once[degree] = matrix
         return Derivate.__non_rat_bezier_once[degree]
 
     @staticmethod
@@ -613,11 +1095,27 @@ class Derivate:
         assert times > 0
         if degree - times < 0:
             return ((0,) * (degree + 1),)
-        matrix = np.eye(degree + 1, dtype="int64")
-        for i in range(times):
-            derive = Derivate.non_rational_bezier_once(degree - i)
-            matrix = np.dot(derive, matrix)
-        return tuple(tuple(line) for line in matrix)
+        if (degree, times) not in Derivate.__non_rat_bezier:
+            matrix = np.eye(degree + 1, dtype="int64")
+            for i in range(times):
+                derive = Derivate.non_rational_bezier_once(degree - i)
+                matrix = np.dot(derive, matrix)
+            matrix = tuple(map(tuple, matrix.tolist()))
+            Derivate.__non_rat_bezier[(degree, times)] = matrix
+        return Derivate.__non_rat_bezier[(degree, times)]
+
+    @staticmethod
+    def non_rational_bezier_f64(degree: int, times: int) -> np.ndarray:
+        """Returns the matrix of ``non_rational_bezier`` as float64
+
+        The array is read-only, since it's shared by all the curves
+        """
+        if (degree, times) not in Derivate.__non_rat_bezier_f64:
+            matrix = Derivate.non_rational_bezier(degree, times)
+            matrix = np.array(matrix, dtype="float64")
+            matrix.setflags(write=False)
+            Derivate.__non_rat_bezier_f64[(degree, times)] = matrix
+        return Derivate.__non_rat_bezier_f64[(degree, times)]
 
 
 class IntegratePlanar:
@@ -626,6 +1124,36 @@ class IntegratePlanar:
     over a bezier curve.
     """
 
+    __quadrature = {}
+    __quadrature_f64 = {}
+
+    @staticmethod
+    def quadrature(nnodes: int) -> Tuple[Tuple[Fraction]]:
+        """Gives the nodes and the weights of the open Newton-Cotes rule
+
+        Both are computed once for each number of nodes
+        """
+        if nnodes not in IntegratePlanar.__quadrature:
+            nodes = Math.open_linspace(nnodes)
+            poids = nurbs.heavy.IntegratorArray.open_newton_cotes(nnodes)
+            IntegratePlanar.__quadrature[nnodes] = (nodes, tuple(poids))
+        return IntegratePlanar.__quadrature[nnodes]
+
+    @staticmethod
+    def quadrature_f64(nnodes: int) -> Tuple[np.ndarray]:
+        """Gives the nodes and the weights of ``quadrature`` as float64
+
+        The arrays are read-only, since they are shared
+        """
+        if nnodes not in IntegratePlanar.__quadrature_f64:
+            nodes, poids = IntegratePlanar.quadrature(nnodes)
+            nodes = np.array(nodes, dtype="float64")
+            poids = np.array(poids, dtype="float64")
+            nodes.setflags(write=False)
+            poids.setflags(write=False)
+            IntegratePlanar.__quadrature_f64[nnodes] = (nodes, poids)
+        return IntegratePlanar.__quadrature_f64[nnodes]
+
     @staticmethod
     def vertical(
         curve: PlanarCurve,
@@ -648,8 +1176,14 @@ class IntegratePlanar:
         assert expx >= 0
         assert expy >= 0
         dcurve = curve.derivate()
-        nodes = Math.open_linspace(nnodes)
-        poids = nurbs.heavy.IntegratorArray.open_newton_cotes(nnodes)
+        if curve.isfloat():
+            nodes, poids = IntegratePlanar.quadrature_f64(nnodes)
+            points = curve.eval_xy(nodes)
+            funcvals = points[:, 0] ** expx
+            funcvals *= points[:, 1] ** expy
+            funcvals *= dcurve.eval_xy(nodes)[:, 1]
+            return float(np.dot(poids, funcvals))
+        nodes, poids = IntegratePlanar.quadrature(nnodes)
         points = curve(nodes)
         xvals = tuple(point[0] ** expx for point in points)
         yvals = tuple(point[1] ** expy for point in points)
@@ -657,6 +1191,33 @@ class IntegratePlanar:
         funcvals = tuple(map(np.prod, zip(xvals, yvals, dyvals)))
         return np.inner(poids, funcvals)
 
+    @staticmethod
+    def moments(
+        curve: PlanarCurve, maxexp: int, nnodes: Optional[int] = None
+    ) -> Tuple[Tuple[float]]:
+        """Computes all the integrals I_{a,b} with a + b <= maxexp
+
+        I_{a,b} = int_C x^a * y^b * dy
+
+        The curve is evaluated only once, with float64 arithmetic.
+        Returns the matrix M with M[a][b] = I_{a,b} and zero if a+b > maxexp
+        """
+        assert isinstance(curve, PlanarCurve)
+        assert isinstance(maxexp, int)
+        assert maxexp >= 0
+        if nnodes is None:
+            nnodes = 3 + maxexp + curve.degree
+        assert isinstance(nnodes, int)
+        assert nnodes >= 0
+        nodes, poids = IntegratePlanar.quadrature_f64(nnodes)
+        points = curve.eval_xy(nodes)
+        dyvals = poids * curve.derivate().eval_xy(nodes)[:, 1]
+        xpowers = np.vander(points[:, 0], maxexp + 1, increasing=True)
+        ypowers = np.vander(points[:, 1], maxexp + 1, increasing=True)
+        matrix = np.dot(xpowers.T, dyvals[:, None] * ypowers)
+        matrix[np.add.outer(range(maxexp + 1), range(maxexp + 1)) > maxexp] = 0
+        return tuple(tuple(line) for line in matrix.tolist())
+
     @staticmethod
     def polynomial(
         curve: PlanarCurve, expx: int, expy: int, nnodes: Optional[int] = None
@@ -674,8 +1235,7 @@ class IntegratePlanar:
         assert expx == 0
         assert expy == 0
         dcurve = curve.derivate()
-        nodes = Math.open_linspace(nnodes)
-        poids = nurbs.heavy.IntegratorArray.open_newton_cotes(nnodes)
+        nodes, poids = IntegratePlanar.quadrature(nnodes)
         funcvals = tuple(abs(point) for point in dcurve(nodes))
         return float(np.inner(poids, funcvals))
 
@@ -730,11 +1290,15 @@ class IntegratePlanar:
         """
         assert isinstance(curve, PlanarCurve)
         nnodes = curve.npts if nnodes is None else nnodes
-        nodes = Math.closed_linspace(nnodes)
-        total = 0
-        for pair_node in zip(nodes[:-1], nodes[1:]):
-            pointa, pointb = curve.eval(pair_node)
-            total += IntegratePlanar.winding_number_linear(
-                pointa, pointb, center
-            )
-        return total
+        if curve.degree == 1 and nnodes == 2:  # Extremities
+            points = curve.xy
+        else:
+            nodes = Math.closed_linspace(nnodes)
+            points = curve.eval_xy(nodes)
+        vectors = points - np.array(tuple(center), dtype="float64")
+        angles = np.arctan2(vectors[:, 1], vectors[:, 0])
+        winds = np.diff(angles) / math.tau
+        uppers, lowers = winds >= 0.5, winds <= -0.5
+        winds[uppers] -= 1
+        winds[lowers] += 1
+        return float(np.sum(winds))
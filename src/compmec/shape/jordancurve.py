@@ -4,17 +4,24 @@ is in fact, stores a list of spline-curves.
 """
 from __future__ import annotations
 
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 from copy import copy
 from fractions import Fraction
 from typing import Optional, Tuple, Union
 
 import numpy as np
 
-from compmec.shape.curve import IntegratePlanar, PlanarCurve
+from compmec.shape.curve import IntegratePlanar, Math, PlanarCurve
 from compmec.shape.polygon import Box, Point2D
 
 
 class IntegrateJordan:
+    __samples = {}  # Arrays used by winding_numbers, by jordan's version
+    max_samples = 1024
+
     @staticmethod
     def vertical(
         jordan: JordanCurve, expx: int, expy: int, nnodes: Optional[int] = None
@@ -25,12 +32,50 @@ class IntegrateJordan:
         I = int x^expx * y^expy * dy
         """
         assert isinstance(jordan, JordanCurve)
+        return IntegrateJordan.vertical_batch((jordan,), expx, expy, nnodes)
+
+    @staticmethod
+    def vertical_batch(
+        jordans: Tuple[JordanCurve],
+        expx: int,
+        expy: int,
+        nnodes: Optional[int] = None,
+    ) -> float:
+        """
+        Computes the sum of the integrals I over all the jordans
+
+        I = int x^expx * y^expy * dy
+
+        The float segments of same degree are stacked and integrated
+        at once, while the exact segments are integrated one by one
+        """
         assert isinstance(expx, int)
         assert isinstance(expy, int)
         assert nnodes is None or isinstance(nnodes, int)
         total = 0
-        for bezier in jordan.segments:
-            total += IntegratePlanar.vertical(bezier, expx, expy, nnodes)
+        groups = {}
+        for jordan in jordans:
+            assert isinstance(jordan, JordanCurve)
+            for bezier in jordan.segments:
+                if bezier.isfloat():
+                    groups.setdefault(bezier.degree, []).append(bezier.xy)
+                else:
+                    total += IntegratePlanar.vertical(
+                        bezier, expx, expy, nnodes
+                    )
+        for degree, ctrlpoints in groups.items():
+            ctrlpoints = np.stack(ctrlpoints)  # shape (nsegs, degree+1, 2)
+            npts = 3 + expx + expy + degree if nnodes is None else nnodes
+            nodes, poids = IntegratePlanar.quadrature_f64(npts)
+            basis = Math.bernstein_batch(degree, nodes)
+            points = np.einsum("nj,sjk->snk", basis, ctrlpoints)
+            dbasis = Math.bernstein_batch(degree - 1, nodes)
+            dyctrl = degree * np.diff(ctrlpoints[:, :, 1], axis=1)
+            dyvals = np.dot(dyctrl, dbasis.T)  # shape (nsegs, npts)
+            funcvals = points[:, :, 0] ** expx
+            funcvals *= points[:, :, 1] ** expy
+            funcvals *= dyvals
+            total += float(np.sum(np.dot(funcvals, poids)))
         return total
 
     @staticmethod
@@ -83,15 +128,114 @@ class IntegrateJordan:
 
         Returns [-1, -0.5, 0, 0.5 or 1]
         """
+        if center not in jordan.box():  # The curve is inside the box
+            return 0
         wind = 0
-        if center in jordan.box():
-            for bezier in jordan.segments:
-                if center in bezier:
-                    return 0.5 if float(jordan) > 0 else -0.5
+        for bezier in jordan.segments:
+            if center in bezier:
+                return 0.5 if jordan.area > 0 else -0.5
         for bezier in jordan.segments:
             wind += IntegratePlanar.winding_number(bezier, center, nnodes)
         return round(wind)
 
+    @staticmethod
+    def winding_numbers(
+        jordan: JordanCurve,
+        centers: Tuple[Point2D],
+        nnodes: Optional[int] = None,
+    ) -> np.ndarray:
+        """Computes the winding number of the jordan curve for many centers
+
+        Same as ``winding_number``, but all the centers are treated at once:
+        the angles of the sampled points of the curve are summed in arrays
+
+        Returns an array with values in [-1, -0.5, 0, 0.5, 1]
+        """
+        centers = tuple(
+            center if isinstance(center, Point2D) else Point2D(center)
+            for center in centers
+        )
+        coords = itertools.chain.from_iterable(centers)
+        coords = np.fromiter(coords, dtype="float64", count=2 * len(centers))
+        coords = coords.reshape(-1, 2)
+        limits = IntegrateJordan.__box_limits((jordan.box(),))
+        inside = IntegrateJordan.__inside_limits(coords, limits)[:, 0]
+        winds = np.zeros(len(centers), dtype="float64")
+        if not np.any(inside):  # All centers are outside the box
+            return winds
+        samples, limits = IntegrateJordan.__sampled(jordan, nnodes)
+        vectors = samples[None, :, :] - coords[inside, None, :]
+        angles = np.arctan2(vectors[:, :, 1], vectors[:, :, 0])
+        diffs = np.diff(angles, axis=1) / math.tau
+        diffs[diffs >= 0.5] -= 1
+        diffs[diffs <= -0.5] += 1
+        winds[inside] = np.round(np.sum(diffs, axis=1))
+        # Only the segments whose box contains the center are projected
+        segments = jordan.segments
+        halfwind = 0.5 if jordan.area > 0 else -0.5
+        indexs = np.flatnonzero(inside)
+        masks = IntegrateJordan.__inside_limits(coords[indexs], limits)
+        for i, mask in zip(indexs, masks):
+            for j in np.flatnonzero(mask):
+                if centers[i] in segments[j]:
+                    winds[i] = halfwind
+                    break
+        return winds
+
+    @staticmethod
+    def __sampled(
+        jordan: JordanCurve, nnodes: Optional[int] = None
+    ) -> Tuple[np.ndarray]:
+        """Gives the sampled points of the jordan curve and the limits
+        of its segments' boxes, used by ``winding_numbers``
+
+        They are computed only once for each version of the jordan
+        """
+        key = (jordan.version, nnodes)
+        if key not in IntegrateJordan.__samples:
+            samples = []
+            for bezier in jordan.segments:
+                npts = bezier.npts if nnodes is None else nnodes
+                if bezier.degree == 1 and npts == 2:  # Extremities
+                    samples.append(bezier.xy)
+                else:
+                    nodes = Math.closed_linspace(npts)
+                    samples.append(bezier.eval_xy(nodes))
+            samples = np.concatenate(samples)
+            boxes = tuple(bezier.box() for bezier in jordan.segments)
+            limits = IntegrateJordan.__box_limits(boxes)
+            samples.setflags(write=False)
+            limits.setflags(write=False)
+            if len(IntegrateJordan.__samples) >= IntegrateJordan.max_samples:
+                IntegrateJordan.__samples.clear()
+            IntegrateJordan.__samples[key] = (samples, limits)
+        return IntegrateJordan.__samples[key]
+
+    @staticmethod
+    def __box_limits(boxes: Tuple[Box]) -> np.ndarray:
+        """Gives the array [(xmin, ymin, xmax, ymax), ...] of the boxes,
+        enlarged by the same tolerances of ``Box.__contains__``"""
+        limits = tuple(
+            (box.lowpt[0], box.lowpt[1], box.toppt[0], box.toppt[1])
+            for box in boxes
+        )
+        limits = np.array(limits, dtype="float64").reshape(-1, 4)
+        limits[:, :2] -= (Box.dx, Box.dy)
+        limits[:, 2:] += (Box.dx, Box.dy)
+        return limits
+
+    @staticmethod
+    def __inside_limits(coords: np.ndarray, limits: np.ndarray) -> np.ndarray:
+        """Tells if each point of ``coords`` is inside each box, given
+        by ``__box_limits``
+
+        Returns a boolean matrix of shape (npoints, nboxes)
+        """
+        xvals, yvals = coords[:, 0, None], coords[:, 1, None]
+        inside = (limits[:, 0] <= xvals) & (xvals <= limits[:, 2])
+        inside &= (limits[:, 1] <= yvals) & (yvals <= limits[:, 3])
+        return inside
+
 
 class JordanCurve:
     """
@@ -99,6 +243,9 @@ class JordanCurve:
     It stores a list of 'segments', each segment is a bezier curve
     """
 
+    min_parallel_pairs = 64  # Minimal number of pairs to use processes
+    __versions = itertools.count()  # Unique values for all the instances
+
     def __init__(self, segments: Tuple[PlanarCurve]):
         self.segments = segments
 
@@ -276,28 +423,27 @@ class JordanCurve:
         for segment in self.segments:
             segment.clean()
         segments = list(self.segments)
-        while True:
-            nsegments = len(segments)
-            for i in range(nsegments):
-                j = (i + 1) % nsegments
-                seg0 = segments[i]
-                seg1 = segments[j]
-                try:
-                    start_point = seg0.ctrlpoints[0]
-                    end_point = seg1.ctrlpoints[-1]
-                    segment = seg0 | seg1
-                    segment.ctrlpoints = (
-                        [start_point]
-                        + list(segment.ctrlpoints[1:-1])
-                        + [end_point]
-                    )
-                    segments[i] = segment
-                    segments.pop(j)
-                    break  # Can unite
-                except ValueError:
-                    pass  # Cannot unite
-            else:  # Cannot unite more segments
-                break
+        i = 0
+        # Single pass: after a union, the new segment is tried again
+        # with the next one, so no pair is tried twice
+        while 1 < len(segments) and i < len(segments):
+            j = (i + 1) % len(segments)
+            seg0 = segments[i]
+            seg1 = segments[j]
+            start_point = seg0.ctrlpoints[0]
+            end_point = seg1.ctrlpoints[-1]
+            try:
+                segment = seg0 | seg1
+            except ValueError:  # Cannot unite
+                i += 1
+                continue
+            segment.ctrlpoints = (
+                [start_point] + list(segment.ctrlpoints[1:-1]) + [end_point]
+            )
+            segments[i] = segment
+            segments.pop(j)
+            if j < i:  # Removed the first segment
+                i -= 1
         self.segments = segments
         return self
 
@@ -321,8 +467,16 @@ class JordanCurve:
 
         """
         point = Point2D(*point)
-        for vertex in self.vertices:
-            vertex.move(point)
+        box = self.__box
+        if self.__isfloat():
+            vector = np.array(tuple(point), dtype="float64")
+            self.__set_coords(self.__coords() + vector)
+        else:
+            for vertex in self.vertices:
+                vertex.move(point)
+            self.__reset_segments()
+        if box is not None:  # Translating the box gives the new box
+            self.__box = Box(box.lowpt + point, box.toppt + point)
         return self
 
     def scale(self, xscale: float, yscale: float) -> JordanCurve:
@@ -351,8 +505,13 @@ class JordanCurve:
         """
         float(xscale)
         float(yscale)
-        for vertex in self.vertices:
-            vertex.scale(xscale, yscale)
+        if self.__isfloat():
+            factors = np.array((xscale, yscale), dtype="float64")
+            self.__set_coords(self.__coords() * factors)
+        else:
+            for vertex in self.vertices:
+                vertex.scale(xscale, yscale)
+            self.__reset_segments()
         return self
 
     def rotate(self, angle: float, degrees: bool = False) -> JordanCurve:
@@ -383,10 +542,49 @@ class JordanCurve:
         float(angle)
         if degrees:
             angle *= np.pi / 180
-        for vertex in self.vertices:
-            vertex.rotate(angle)
+        cos, sin = np.cos(angle), np.sin(angle)
+        matrix = np.array(((cos, sin), (-sin, cos)))
+        self.__set_coords(np.dot(self.__coords(), matrix))
         return self
 
+    def __isfloat(self) -> bool:
+        return all(segment.isfloat() for segment in self.segments)
+
+    def __coords(self) -> np.ndarray:
+        """Returns the coordinates of the vertices, of shape (n, 2)
+
+        The array is computed once and kept until the vertices change
+        """
+        if self.__vertex_coords is None:
+            coords = tuple(map(tuple, self.vertices))
+            coords = np.array(coords, dtype="float64").reshape(-1, 2)
+            coords.setflags(write=False)
+            self.__vertex_coords = coords
+        return self.__vertex_coords
+
+    def __set_coords(self, coords: np.ndarray):
+        """Writes the coordinates in the vertices, keeping the instances,
+        and keeps the array to be reused"""
+        for vertex, (xval, yval) in zip(self.vertices, coords.tolist()):
+            vertex.place(xval, yval)
+        self.__reset_segments()
+        coords.setflags(write=False)
+        self.__vertex_coords = coords
+
+    def __reset_segments(self):
+        """Clears the values stored by the segments and by the curve
+
+        Must be called after the control points are changed in place
+        """
+        for segment in self.segments:
+            segment.ctrlpoints = segment.ctrlpoints
+        self.__box = None
+        self.__area = None
+        self.__lenght = None
+        self.__clean_copy = None
+        self.__vertex_coords = None
+        self.__version = next(JordanCurve.__versions)
+
     def invert(self) -> JordanCurve:
         """Invert the current curve's orientation, doesn't create a copy
 
@@ -546,10 +744,18 @@ class JordanCurve:
         Box with vertices (0, 0) and (4, 3)
 
         """
-        box = None
-        for bezier in self.segments:
-            box |= bezier.box()
-        return box
+        if self.__box is None:
+            if self.__isfloat():  # All the control points at once
+                coords = self.__coords()
+                lowpt = Point2D(*np.min(coords, axis=0).tolist())
+                toppt = Point2D(*np.max(coords, axis=0).tolist())
+                self.__box = Box(lowpt, toppt)
+            else:
+                box = None
+                for bezier in self.segments:
+                    box |= bezier.box()
+                self.__box = box
+        return self.__box
 
     @property
     def segments(self) -> Tuple[PlanarCurve]:
@@ -574,7 +780,7 @@ class JordanCurve:
         Planar curve of degree 1 and control points ((0, 0), (4, 0))
 
         """
-        return tuple(self.__segments)
+        return self.__segments
 
     @property
     def vertices(self) -> Tuple[Point2D]:
@@ -596,14 +802,16 @@ class JordanCurve:
         ((0, 0), (4, 0), (0, 3))
 
         """
-        ids = []
-        vertices = []
-        for segment in self.segments:
-            for point in segment.ctrlpoints:
-                if id(point) not in ids:
-                    ids.append(id(point))
-                    vertices.append(point)
-        return tuple(vertices)
+        if self.__vertices is None:
+            ids = set()
+            vertices = []
+            for segment in self.segments:
+                for point in segment.ctrlpoints:
+                    if id(point) not in ids:
+                        ids.add(id(point))
+                        vertices.append(point)
+            self.__vertices = tuple(vertices)
+        return self.__vertices
 
     @segments.setter
     def segments(self, other: Tuple[PlanarCurve]):
@@ -618,7 +826,13 @@ class JordanCurve:
             assert id(start_point) == id(end_point)
         for segment in other:
             segment.clean()
+        self.__box = None
+        self.__area = None
         self.__lenght = None
+        self.__clean_copy = None
+        self.__vertex_coords = None
+        self.__version = next(JordanCurve.__versions)
+        self.__vertices = None
         segments = []
         for bezier in other:
             ctrlpoints = [Point2D(point) for point in bezier.ctrlpoints]
@@ -646,22 +860,50 @@ class JordanCurve:
 
     def __eq__(self, other: JordanCurve) -> bool:
         assert isinstance(other, JordanCurve)
+        selfends = tuple(segment.ctrlpoints[0] for segment in self.segments)
+        othends = tuple(segment.ctrlpoints[0] for segment in other.segments)
+        # Each curve is inside the box of the other's control points
+        selbox, othbox = self.box(), other.box()
+        for point in selfends:
+            if point not in othbox:
+                return False
+        for point in othends:
+            if point not in selbox:
+                return False
+        # Points which are vertices of self don't need the projection
+        known = set((point[0], point[1]) for point in selfends)
         for point in other.points(1):
-            if point not in self:
+            if point not in known and point not in self:
                 return False
-        selcopy = self.__copy__().clean()
-        othcopy = other.__copy__().clean()
-        if len(selcopy.segments) != len(othcopy.segments):
+        if len(self.segments) == len(other.segments):
+            if self.__cyclic_equal(self.segments, other.segments):
+                return True
+        return self.__cyclic_equal(
+            self.__cleaned().segments, other.__cleaned().segments
+        )
+
+    def __cleaned(self) -> JordanCurve:
+        """Returns a cleaned copy of the curve, stored to be reused"""
+        if self.__clean_copy is None:
+            self.__clean_copy = self.__copy__().clean()
+        return self.__clean_copy
+
+    @staticmethod
+    def __cyclic_equal(
+        segmentsa: Tuple[PlanarCurve], segmentsb: Tuple[PlanarCurve]
+    ) -> bool:
+        """Tells if the segments are equal, up to a cyclic shift"""
+        nsegments = len(segmentsa)
+        if nsegments != len(segmentsb):
             return False
-        segment1 = othcopy.segments[0]
-        for index, segment0 in enumerate(selcopy.segments):
+        segment1 = segmentsb[0]
+        for index, segment0 in enumerate(segmentsa):
             if segment0 == segment1:
                 break
         else:
             return False
-        nsegments = len(self.segments)
-        for i, segment1 in enumerate(othcopy.segments):
-            segment0 = selcopy.segments[(i + index) % nsegments]
+        for i, segment1 in enumerate(segmentsb):
+            segment0 = segmentsa[(i + index) % nsegments]
             if segment0 != segment1:
                 return False
         return True
@@ -702,17 +944,50 @@ class JordanCurve:
         """
         if self.__lenght is None:
             lenght = IntegrateJordan.lenght(self)
-            area = IntegrateJordan.area(self)
-            self.__lenght = lenght if area > 0 else -lenght
+            self.__lenght = lenght if self.area > 0 else -lenght
         return self.__lenght
 
+    @property
+    def area(self) -> float:
+        """Interior area of the jordan curve
+
+        If jordan curve is clockwise, then area < 0
+
+        :getter: Returns the stored area, computed once
+        :type: float
+
+        Example use
+        -----------
+
+        >>> from compmec.shape import JordanCurve
+        >>> vertices = [(0, 0), (4, 0), (0, 3)]
+        >>> jordan = JordanCurve.from_vertices(vertices)
+        >>> print(jordan.area)
+        6
+        """
+        if self.__area is None:
+            self.__area = IntegrateJordan.area(self)
+        return self.__area
+
+    @property
+    def version(self) -> int:
+        """Number which changes each time the curve changes
+
+        It's unique among all the jordan curves, so two equal
+        versions mean the same unchanged curve
+
+        :getter: Returns the current version
+        :type: int
+        """
+        return self.__version
+
     def __abs__(self) -> JordanCurve:
         """Returns the same curve, but in positive direction"""
         copy = self.__copy__()
         return copy if float(self) > 0 else copy.invert()
 
     def __intersection(
-        self, other: JordanCurve
+        self, other: JordanCurve, n_jobs: Optional[int] = 1
     ) -> Tuple[Tuple[int, int, float, float]]:
         """Private method of ``intersection``
 
@@ -725,15 +1000,29 @@ class JordanCurve:
 
         """
         intersections = set()
-        for ai, sbezier in enumerate(self.segments):
-            for bj, obezier in enumerate(other.segments):
-                inters = sbezier & obezier
-                if inters is None:
-                    continue
-                if len(inters) == 0:  # Equal curves
-                    intersections.add((ai, bj, None, None))
-                for ui, vj in inters:
-                    intersections.add((ai, bj, ui, vj))
+        obox = other.box()
+        if self.box() & obox is None:
+            return list(intersections)
+        sboxes = tuple(sbezier.box() for sbezier in self.segments)
+        oboxes = tuple(obezier.box() for obezier in other.segments)
+        indexs = Box.overlapping_pairs(sboxes, oboxes)
+        if n_jobs == 1 or len(indexs) < JordanCurve.min_parallel_pairs:
+            all_inters = tuple(
+                self.segments[ai] & other.segments[bj] for ai, bj in indexs
+            )
+        else:
+            pairs = tuple(
+                (self.segments[ai].ctrlpoints, other.segments[bj].ctrlpoints)
+                for ai, bj in indexs
+            )
+            all_inters = parallel_intersect_segments(pairs, n_jobs)
+        for (ai, bj), inters in zip(indexs, all_inters):
+            if inters is None:
+                continue
+            if len(inters) == 0:  # Equal curves
+                intersections.add((ai, bj, None, None))
+            for ui, vj in inters:
+                intersections.add((ai, bj, ui, vj))
         return list(intersections)
 
     def intersection(
@@ -741,6 +1030,7 @@ class JordanCurve:
         other: JordanCurve,
         equal_beziers: bool = True,
         end_points: bool = True,
+        n_jobs: Optional[int] = 1,
     ) -> Tuple[Tuple[int, int, float, float]]:
         """Computes the intersection between two jordan curves
 
@@ -777,6 +1067,13 @@ class JordanCurve:
 
             If the flag ``end_points`` are inactive, then will remove when ``(ui, vi)`` are ``(0, 0)``, ``(0, 1)``, ``(1, 0)`` or ``(1, 1)``
 
+        n_jobs : int, default = 1
+            Number of processes used to intersect the pairs of segments
+
+            If ``None``, uses all the processors. Only used when there
+            are at least ``JordanCurve.min_parallel_pairs`` pairs of
+            segments to intersect
+
         :return: The matrix of coefficients ``[(ai, bi, ui, vi)]`` or an empty tuple in case of non-intersection
         :rtype: tuple[(int, int, float, float)]
 
@@ -793,7 +1090,8 @@ class JordanCurve:
 
         """
         assert isinstance(other, JordanCurve)
-        intersections = self.__intersection(other)
+        assert n_jobs is None or (isinstance(n_jobs, int) and n_jobs > 0)
+        intersections = self.__intersection(other, n_jobs)
         # Filter the values
         if not equal_beziers:
             for ai, bi, ui, vi in tuple(intersections):
@@ -805,3 +1103,41 @@ class JordanCurve:
                     continue
                 intersections.remove((ai, bi, ui, vi))
         return tuple(sorted(intersections))
+
+
+def intersect_segments(
+    pairs: Tuple[Tuple[Tuple[Point2D], Tuple[Point2D]]]
+) -> Tuple[Union[None, Tuple[Tuple[float]]]]:
+    """Computes the intersection of each pair of segments
+
+    Each pair is given by the control points of the two segments,
+    and the result of ``PlanarCurve.__and__`` is returned for each pair
+    """
+    results = []
+    for ctrlpointsa, ctrlpointsb in pairs:
+        results.append(PlanarCurve(ctrlpointsa) & PlanarCurve(ctrlpointsb))
+    return tuple(results)
+
+
+def parallel_intersect_segments(
+    pairs: Tuple[Tuple[Tuple[Point2D], Tuple[Point2D]]],
+    n_jobs: Optional[int] = None,
+) -> Tuple[Union[None, Tuple[Tuple[float]]]]:
+    """Same as ``intersect_segments``, but distributes the pairs
+    between ``n_jobs`` processes
+
+    Only the coordinates are sent to the processes, since
+    Point2D instances cannot be pickled
+    """
+    n_jobs = os.cpu_count() if n_jobs is None else n_jobs
+    pairs = tuple(
+        tuple(tuple(tuple(point) for point in points) for points in pair)
+        for pair in pairs
+    )
+    size = -(-len(pairs) // n_jobs)  # ceil division
+    chunks = [pairs[i : i + size] for i in range(0, len(pairs), size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        for chunk_results in executor.map(intersect_segments, chunks):
+            results += chunk_results
+    return tuple(results)
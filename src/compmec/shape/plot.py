@@ -134,7 +134,7 @@ class ShapePloter:
             self.gca().add_patch(patch)
             for jordan in connected.jordans:
                 path = path_jordan(jordan)
-                color = pos_color if float(jordan) > 0 else neg_color
+                color = pos_color if jordan.area > 0 else neg_color
                 patch = PathPatch(
                     path, edgecolor=color, facecolor="none", lw=2
                 )
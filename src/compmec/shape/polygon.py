@@ -180,6 +180,17 @@ class Point2D(object):
         self._y += vector[1]
         return self
 
+    def place(self, xval: float, yval: float) -> Point2D:
+        """
+        Puts the current point at the position (xval, yval)
+        Doesn't create a copy
+        """
+        float(xval)
+        float(yval)
+        self._x = xval
+        self._y = yval
+        return self
+
     def rotate(self, angle: float) -> Point2D:
         """
         Rotates the current point with respect to origin
@@ -260,3 +271,36 @@ class Box:
         if ymax < ymin:
             return None
         return Box(Point2D(xmin, ymin), Point2D(xmax, ymax))
+
+    @staticmethod
+    def overlapping_pairs(
+        boxesa: Tuple[Box], boxesb: Tuple[Box]
+    ) -> Tuple[Tuple[int, int]]:
+        """Finds all the pairs (i, j) such boxesa[i] & boxesb[j] is not None
+
+        The boxes ``boxesb`` are sorted by their lower x value, so for
+        each box of ``boxesa`` only the boxes of ``boxesb`` which start
+        before its end are verified, instead of all of them.
+        The pairs are returned sorted
+        """
+        limitsa = tuple(
+            (box.lowpt[0], box.lowpt[1], box.toppt[0], box.toppt[1])
+            for box in boxesa
+        )
+        limitsb = tuple(
+            (box.lowpt[0], box.lowpt[1], box.toppt[0], box.toppt[1])
+            for box in boxesb
+        )
+        limitsa = np.array(limitsa, dtype="float64").reshape(-1, 4)
+        limitsb = np.array(limitsb, dtype="float64").reshape(-1, 4)
+        order = np.argsort(limitsb[:, 0], kind="stable")
+        limitsb = limitsb[order]
+        ends = np.searchsorted(limitsb[:, 0], limitsa[:, 2], side="right")
+        pairs = []
+        for i, (xmin, ymin, _, ymax) in enumerate(limitsa):
+            candidates = limitsb[: ends[i]]
+            mask = xmin <= candidates[:, 2]
+            mask &= (ymin <= candidates[:, 3]) & (candidates[:, 1] <= ymax)
+            indexs = sorted(order[: ends[i]][mask].tolist())
+            pairs += [(i, j) for j in indexs]
+        return tuple(pairs)
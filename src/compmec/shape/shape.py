@@ -9,12 +9,15 @@ or even unconnected shapes.
 from __future__ import annotations
 
 import abc
+import math
+from bisect import bisect_left, bisect_right
 from copy import copy
-from fractions import Fraction
-from typing import Any, Optional, Tuple, Union
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
+from compmec.shape.curve import PlanarCurve
 from compmec.shape.jordancurve import IntegrateJordan, JordanCurve
 from compmec.shape.polygon import Box, Point2D
 
@@ -83,9 +86,8 @@ class IntegrateShape:
         assert isinstance(expx, int)
         assert isinstance(expy, int)
         assert nnodes is None or isinstance(nnodes, int)
-        total = 0
-        for jordan in shape.jordans:
-            total += IntegrateJordan.vertical(jordan, expx + 1, expy, nnodes)
+        jordans = shape.jordans
+        total = IntegrateJordan.vertical_batch(jordans, expx + 1, expy, nnodes)
         return total / (1 + expx)
 
     @staticmethod
@@ -123,6 +125,8 @@ class IntegrateShape:
         >>> print(inertia_xx)
 
         """
+        if nnodes is None:  # Uses the area stored by each jordan
+            return sum(jordan.area for jordan in shape.jordans)
         return IntegrateShape.polynomial(shape, 0, 0, nnodes)
 
 
@@ -133,6 +137,10 @@ class FollowPath:
 
     """
 
+    cell_size = 1e-6  # Size of the grid used to find equal points
+    splitted = set()  # Versions of the pairs of jordans already splitted
+    max_splitted = 1024
+
     @staticmethod
     def split_two_jordans(jordana: JordanCurve, jordanb: JordanCurve):
         """
@@ -141,6 +149,9 @@ class FollowPath:
         """
         assert isinstance(jordana, JordanCurve)
         assert isinstance(jordanb, JordanCurve)
+        versions = (jordana.version, jordanb.version)
+        if versions in FollowPath.splitted:  # Already splitted
+            return
         if jordana.box() & jordanb.box() is None:
             return
         all_positions = (set(), set())
@@ -153,10 +164,30 @@ class FollowPath:
             indexs = [position[0] for position in positions]
             nodes = [position[1] for position in positions]
             jordan.split(indexs, nodes)
+        if len(FollowPath.splitted) > FollowPath.max_splitted:
+            FollowPath.splitted.clear()
+        FollowPath.splitted.add((jordana.version, jordanb.version))
+
+    @staticmethod
+    def split_jordans(
+        jordansa: Tuple[JordanCurve], jordansb: Tuple[JordanCurve]
+    ):
+        """
+        Calls ``split_two_jordans`` for each pair of jordans, from
+        ``jordansa`` and ``jordansb``, whose boxes overlap
+        """
+        boxesa = tuple(jordan.box() for jordan in jordansa)
+        boxesb = tuple(jordan.box() for jordan in jordansb)
+        for i, j in Box.overlapping_pairs(boxesa, boxesb):
+            FollowPath.split_two_jordans(jordansa[i], jordansb[j])
 
     @staticmethod
     def pursue_path(
-        index_jordan: int, index_segment: int, jordans: Tuple[JordanCurve]
+        index_jordan: int,
+        index_segment: int,
+        jordans: Tuple[JordanCurve],
+        all_segments: Optional[Tuple[Tuple[PlanarCurve]]] = None,
+        start_points: Optional[Dict[Tuple[int, int], List[Tuple[int]]]] = None,
     ) -> Tuple[Tuple[int]]:
         """
         Given a list of jordans, it returns a matrix of integers like
@@ -171,32 +202,68 @@ class FollowPath:
         the start point of jordans[a1].segments[b1]
 
         We suppose there's no triple intersection
+
+        The segments of the jordans and the map given by ``start_points``
+        can be given, to be computed only once for many paths
         """
         matrix = []
-        all_segments = [jordan.segments for jordan in jordans]
+        visited = set()
+        if all_segments is None:
+            all_segments = tuple(jordan.segments for jordan in jordans)
+        if start_points is None:
+            start_points = FollowPath.start_points(jordans)
         while True:
             index_segment %= len(all_segments[index_jordan])
             segment = all_segments[index_jordan][index_segment]
-            if (index_jordan, index_segment) in matrix:
+            if (index_jordan, index_segment) in visited:
                 break
             matrix.append((index_jordan, index_segment))
+            visited.add((index_jordan, index_segment))
             last_point = segment.ctrlpoints[-1]
+            cellx, celly = FollowPath.cell(last_point)
             possibles = []
-            for i, jordan in enumerate(jordans):
+            for i, j in (
+                index
+                for dx in (-1, 0, 1)
+                for dy in (-1, 0, 1)
+                for index in start_points.get((cellx + dx, celly + dy), ())
+            ):
                 if i == index_jordan:
                     continue
-                if last_point in jordan:
-                    possibles.append(i)
+                if all_segments[i][j].ctrlpoints[0] == last_point:
+                    possibles.append((i, j))
             if len(possibles) == 0:
                 index_segment += 1
                 continue
-            index_jordan = possibles[0]
-            for j, segj in enumerate(all_segments[index_jordan]):
-                if segj.ctrlpoints[0] == last_point:
-                    index_segment = j
-                    break
+            index_jordan, index_segment = min(possibles)
         return tuple(matrix)
 
+    @staticmethod
+    def cell(point: Point2D) -> Tuple[int, int]:
+        """
+        Gives the cell of the grid, of size ``FollowPath.cell_size``,
+        which contains the point
+        """
+        size = FollowPath.cell_size
+        return (math.floor(point[0] / size), math.floor(point[1] / size))
+
+    @staticmethod
+    def start_points(
+        jordans: Tuple[JordanCurve],
+    ) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
+        """
+        Maps each cell of the grid to the indexs (i, j) such the
+        start point of jordans[i].segments[j] is inside the cell.
+        Since the cells are bigger than the tolerance of Point2D,
+        equal points are always in neighbor cells
+        """
+        start_points = {}
+        for i, jordan in enumerate(jordans):
+            for j, segment in enumerate(jordan.segments):
+                cell = FollowPath.cell(segment.ctrlpoints[0])
+                start_points.setdefault(cell, []).append((i, j))
+        return start_points
+
     @staticmethod
     def is_rotation(oneobj: Tuple[Any], other: Tuple[Any]) -> bool:
         """
@@ -222,6 +289,36 @@ class FollowPath:
                 return False
         return True
 
+    @staticmethod
+    def canonical_rotation(oneobj: Tuple[Any]) -> Tuple[Any]:
+        """
+        Returns the lexicographically smallest rotation of the list,
+        found in linear time by Booth's algorithm.
+        Two lists are rotations of each other only if
+        their canonical rotations are equal
+
+        Example:
+        canonical_rotation([B, C, A]) -> (A, B, C)
+        """
+        oneobj = tuple(oneobj)
+        double = oneobj + oneobj
+        failure = [-1] * len(double)
+        start = 0
+        for j in range(1, len(double)):
+            elem = double[j]
+            i = failure[j - start - 1]
+            while i != -1 and elem != double[start + i + 1]:
+                if elem < double[start + i + 1]:
+                    start = j - i - 1
+                i = failure[i]
+            if elem != double[start + i + 1]:  # Here i == -1
+                if elem < double[start]:
+                    start = j
+                failure[j - start] = -1
+            else:
+                failure[j - start] = i + 1
+        return double[start : start + len(oneobj)]
+
     @staticmethod
     def filter_rotations(matrix: Tuple[Tuple[Any]]):
         """
@@ -231,12 +328,12 @@ class FollowPath:
         filter_tuples([[A, B, C], [B, C, A]]) -> [[A, B, C]]
         filter_tuples([[A, B, C], [C, B, A]]) -> [[A, B, C], [C, B, A]]
         """
+        canonicals = set()
         filtered = []
         for line in matrix:
-            for fline in filtered:
-                if FollowPath.is_rotation(line, fline):
-                    break
-            else:
+            canonical = FollowPath.canonical_rotation(line)
+            if canonical not in canonicals:
+                canonicals.add(canonical)
                 filtered.append(line)
         return tuple(filtered)
 
@@ -269,9 +366,13 @@ class FollowPath:
         """
         for jordan in jordans:
             assert isinstance(jordan, JordanCurve)
+        all_segments = tuple(jordan.segments for jordan in jordans)
+        start_points = FollowPath.start_points(jordans)
         bez_indexs = []
         for ind_jord, ind_seg in start_indexs:
-            indices_matrix = FollowPath.pursue_path(ind_jord, ind_seg, jordans)
+            indices_matrix = FollowPath.pursue_path(
+                ind_jord, ind_seg, jordans, all_segments, start_points
+            )
             bez_indexs.append(indices_matrix)
         bez_indexs = FollowPath.filter_rotations(bez_indexs)
         new_jordans = []
@@ -280,6 +381,41 @@ class FollowPath:
             new_jordans.append(jordan)
         return tuple(new_jordans)
 
+    @staticmethod
+    def midpoints_positions(
+        shapea: BaseShape, shapeb: BaseShape
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns a matrix [(a0, b0), (a1, b1), ...] with all the
+        segments of shapea.jordans, and the position of the middle point
+        of shapea.jordans[ai].segments[bi] relative to shapeb:
+        0 if outside, 0.5 if on the boundary and 1 if inside
+        """
+        indexs = []
+        mid_points = []
+        for i, jordan in enumerate(shapea.jordans):
+            for j, segment in enumerate(jordan.segments):
+                indexs.append((i, j))
+                # Float evaluation is enough for the containment test
+                mid_points.append(segment.eval_xy((0.5,))[0].tolist())
+        indexs = np.array(indexs, dtype="int64").reshape(-1, 2)
+        return indexs, shapeb._positions(mid_points)
+
+    @staticmethod
+    def filter_positions(
+        indexs: np.ndarray,
+        positions: np.ndarray,
+        closed: bool,
+        inside: bool,
+    ) -> Tuple[Tuple[int]]:
+        """
+        Keeps the indexs whose positions are inside/outside.
+        If ``closed`` is True, a boundary point is inside
+        """
+        contains = positions > 0 if closed else positions == 1
+        mask = contains if inside else ~contains
+        return tuple(map(tuple, indexs[mask].tolist()))
+
     @staticmethod
     def midpoints_one_shape(
         shapea: BaseShape, shapeb: BaseShape, closed: bool, inside: bool
@@ -295,41 +431,36 @@ class FollowPath:
         If ``closed=False``, a boundary point is outside
 
         """
+        indexs, positions = FollowPath.midpoints_positions(shapea, shapeb)
+        return FollowPath.filter_positions(indexs, positions, closed, inside)
 
-        insiders = []
-        outsiders = []
-        for i, jordan in enumerate(shapea.jordans):
-            for j, segment in enumerate(jordan.segments):
-                mid_point = segment(Fraction(1, 2))
-                if shapeb.contains_point(mid_point, closed):
-                    insiders.append((i, j))
-                else:
-                    outsiders.append((i, j))
-        return tuple(insiders) if inside else tuple(outsiders)
+    @staticmethod
+    def midpoints_both_shapes(
+        shapea: BaseShape, shapeb: BaseShape
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Same as ``midpoints_positions``, for the segments of both shapes.
+        The indexs of shapeb's jordans are shifted by len(shapea.jordans)
+        """
+        indexsa, positionsa = FollowPath.midpoints_positions(shapea, shapeb)
+        indexsb, positionsb = FollowPath.midpoints_positions(shapeb, shapea)
+        njordansa = len(shapea.jordans)
+        indexsb = indexsb + (njordansa, 0)
+        indexs = np.concatenate((indexsa, indexsb))
+        return indexs, np.concatenate((positionsa, positionsb))
 
     @staticmethod
     def midpoints_shapes(
         shapea: BaseShape, shapeb: BaseShape, closed: bool, inside: bool
     ) -> Tuple[Tuple[int]]:
-        indexsa = FollowPath.midpoints_one_shape(
-            shapea, shapeb, closed, inside
-        )
-        indexsb = FollowPath.midpoints_one_shape(
-            shapeb, shapea, closed, inside
-        )
-        indexsa = list(indexsa)
-        njordansa = len(shapea.jordans)
-        for indjorb, indsegb in indexsb:
-            indexsa.append((njordansa + indjorb, indsegb))
-        return tuple(indexsa)
+        indexs, positions = FollowPath.midpoints_both_shapes(shapea, shapeb)
+        return FollowPath.filter_positions(indexs, positions, closed, inside)
 
     @staticmethod
     def or_shapes(shapea: BaseShape, shapeb: BaseShape) -> Tuple[JordanCurve]:
         assert isinstance(shapea, BaseShape)
         assert isinstance(shapeb, BaseShape)
-        for jordana in shapea.jordans:
-            for jordanb in shapeb.jordans:
-                FollowPath.split_two_jordans(jordana, jordanb)
+        FollowPath.split_jordans(shapea.jordans, shapeb.jordans)
         indexs = FollowPath.midpoints_shapes(
             shapea, shapeb, closed=True, inside=False
         )
@@ -341,9 +472,7 @@ class FollowPath:
     def and_shapes(shapea: BaseShape, shapeb: BaseShape) -> Tuple[JordanCurve]:
         assert isinstance(shapea, BaseShape)
         assert isinstance(shapeb, BaseShape)
-        for jordana in shapea.jordans:
-            for jordanb in shapeb.jordans:
-                FollowPath.split_two_jordans(jordana, jordanb)
+        FollowPath.split_jordans(shapea.jordans, shapeb.jordans)
         indexs = FollowPath.midpoints_shapes(
             shapea, shapeb, closed=False, inside=True
         )
@@ -351,6 +480,29 @@ class FollowPath:
         new_jordans = FollowPath.follow_path(all_jordans, indexs)
         return new_jordans
 
+    @staticmethod
+    def or_and_shapes(
+        shapea: BaseShape, shapeb: BaseShape
+    ) -> Tuple[Tuple[JordanCurve], Tuple[JordanCurve]]:
+        """
+        Gives the results of both ``or_shapes`` and ``and_shapes``,
+        splitting the jordans and testing the middle points only once
+        """
+        assert isinstance(shapea, BaseShape)
+        assert isinstance(shapeb, BaseShape)
+        FollowPath.split_jordans(shapea.jordans, shapeb.jordans)
+        indexs, positions = FollowPath.midpoints_both_shapes(shapea, shapeb)
+        all_jordans = tuple(shapea.jordans) + tuple(shapeb.jordans)
+        or_indexs = FollowPath.filter_positions(
+            indexs, positions, closed=True, inside=False
+        )
+        and_indexs = FollowPath.filter_positions(
+            indexs, positions, closed=False, inside=True
+        )
+        or_jordans = FollowPath.follow_path(all_jordans, or_indexs)
+        and_jordans = FollowPath.follow_path(all_jordans, and_indexs)
+        return or_jordans, and_jordans
+
 
 class BaseShape(object, metaclass=SuperclassMeta):
     """
@@ -364,6 +516,8 @@ class BaseShape(object, metaclass=SuperclassMeta):
      - XOR
     """
 
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -410,6 +564,7 @@ class BaseShape(object, metaclass=SuperclassMeta):
 class SingletonShape(BaseShape):
     """SingletonShape"""
 
+    __slots__ = ()
     __instance = None
 
     def __new__(cls):
@@ -439,6 +594,8 @@ class EmptyShape(SingletonShape):
     False
     """
 
+    __slots__ = ()
+
     def __or__(self, other: BaseShape) -> BaseShape:
         return copy(other)
 
@@ -479,6 +636,8 @@ class WholeShape(SingletonShape):
     True
     """
 
+    __slots__ = ()
+
     def __or__(self, other: BaseShape) -> WholeShape:
         return self
 
@@ -510,6 +669,8 @@ class DefinedShape(BaseShape):
 
     """
 
+    __slots__ = ("__box",)
+
     def __init__(self, *args, **kwargs):
         self.__box = None
 
@@ -539,20 +700,49 @@ class DefinedShape(BaseShape):
         Box with vertices (-1.0, -1.0) and (1., 1.0)
 
         """
+        boxes = tuple(jordan.box() for jordan in self.jordans)
+        if self.__box is not None:  # Valid while the jordans' boxes are
+            old_boxes, box = self.__box
+            if len(old_boxes) == len(boxes) and all(
+                old is new for old, new in zip(old_boxes, boxes)
+            ):
+                return box
         box = None
-        for jordan in self.jordans:
-            box |= jordan.box()
+        for jordan_box in boxes:
+            box |= jordan_box
+        self.__box = (boxes, box)
         return box
 
     def __invert__(self) -> BaseShape:
         return ShapeFromJordans(tuple(~jordan for jordan in self.jordans))
 
+    def __isbounded(self) -> bool:
+        """Tells if all the subshapes are bounded, with positive area"""
+        if isinstance(self, DisjointShape):
+            return all(float(subshape) > 0 for subshape in self.subshapes)
+        return float(self) > 0
+
+    def __isdisjoint(self, other: DefinedShape) -> bool:
+        """Tells if both shapes are bounded and their boxes don't overlap,
+        which is enough to say they have no common point"""
+        if self.box() & other.box() is not None:
+            return False
+        return self.__isbounded() and other.__isbounded()
+
     def __or__(self, other: BaseShape) -> BaseShape:
         assert isinstance(other, BaseShape)
         if isinstance(other, WholeShape):
             return WholeShape()
-        if isinstance(other, EmptyShape):
+        if isinstance(other, EmptyShape) or other is self:
             return copy(self)
+        if self.__isdisjoint(other):
+            subshapes = []
+            for shape in (self, other):
+                if isinstance(shape, DisjointShape):
+                    subshapes.extend(shape.subshapes)
+                else:
+                    subshapes.append(shape)
+            return DisjointShape(tuple(map(copy, subshapes)))
         if other in self:
             return copy(self)
         if self in other:
@@ -564,10 +754,12 @@ class DefinedShape(BaseShape):
 
     def __and__(self, other: BaseShape) -> BaseShape:
         assert isinstance(other, BaseShape)
-        if isinstance(other, WholeShape):
+        if isinstance(other, WholeShape) or other is self:
             return copy(self)
         if isinstance(other, EmptyShape):
             return EmptyShape()
+        if self.__isdisjoint(other):
+            return EmptyShape()
         if other in self:
             return copy(other)
         if self in other:
@@ -577,6 +769,33 @@ class DefinedShape(BaseShape):
             return EmptyShape()
         return ShapeFromJordans(new_jordans)
 
+    def __sub__(self, other: BaseShape) -> BaseShape:
+        assert isinstance(other, BaseShape)
+        if isinstance(other, DefinedShape) and self.__isdisjoint(other):
+            return copy(self)
+        return super().__sub__(other)
+
+    def __xor__(self, other: BaseShape) -> BaseShape:
+        assert isinstance(other, BaseShape)
+        if not isinstance(other, DefinedShape):
+            return super().__xor__(other)
+        if self.__isdisjoint(other):
+            return self | other
+        # Union and intersection come from the same splitted jordans
+        if other in self:
+            union, intersection = copy(self), copy(other)
+        elif self in other:
+            union, intersection = copy(other), copy(self)
+        else:
+            or_jordans, and_jordans = FollowPath.or_and_shapes(self, other)
+            union = WholeShape()
+            if len(or_jordans) != 0:
+                union = ShapeFromJordans(or_jordans)
+            intersection = EmptyShape()
+            if len(and_jordans) != 0:
+                intersection = ShapeFromJordans(and_jordans)
+        return union - intersection
+
     def __contains__(
         self, other: Union[Point2D, JordanCurve, BaseShape]
     ) -> bool:
@@ -584,8 +803,7 @@ class DefinedShape(BaseShape):
             return self.contains_shape(other)
         if isinstance(other, JordanCurve):
             return self.contains_jordan(other)
-        point = Point2D(other)
-        return self.contains_point(point)
+        return self.contains_point(other)
 
     def __float__(self) -> float:
         return float(IntegrateShape.area(self))
@@ -698,10 +916,48 @@ class DefinedShape(BaseShape):
         False
 
         """
-        point = Point2D(point)
+        if not isinstance(point, Point2D):  # Point2D(point) would reinit it
+            point = Point2D(point)
         assert isinstance(boundary, bool)
         return self._contains_point(point, boundary)
 
+    def contains_points(
+        self, points: Tuple[Point2D], boundary: Optional[bool] = True
+    ) -> np.ndarray:
+        """
+        Checks if each one of the given points is inside the shape
+
+        Same as ``contains_point``, but all the points are treated at once
+
+        Parameters
+        ----------
+
+        points : tuple[Point2D]
+            The points to verify if are inside
+        boundary : bool, default = True
+            The flag to decide if a boundary point is considered inside
+            or outside. If ``True``, then a boundary point is considered
+            inside.
+
+        :return: Whether each point is inside or not
+        :rtype: numpy.ndarray
+
+
+        Example use
+        -----------
+        >>> from compmec.shape import Primitive
+        >>> square = Primitive.square()
+        >>> square.contains_points([(0, 0), (0.5, 0), (1, 0)])
+        array([ True,  True, False])
+
+        """
+        points = tuple(
+            point if isinstance(point, Point2D) else Point2D(point)
+            for point in points
+        )
+        assert isinstance(boundary, bool)
+        return self._contains_points(points, boundary)
+
     def contains_jordan(
         self, jordan: JordanCurve, boundary: Optional[bool] = True
     ) -> bool:
@@ -768,6 +1024,18 @@ class DefinedShape(BaseShape):
     def _contains_point(point: Point2D, boundary: Optional[bool] = True):
         pass
 
+    def _contains_points(
+        self, points: Tuple[Point2D], boundary: Optional[bool] = True
+    ) -> np.ndarray:
+        """Vectorized version of ``_contains_point``"""
+        positions = self._positions(points)
+        return positions > 0 if boundary else positions == 1
+
+    @abc.abstractmethod
+    def _positions(points: Tuple[Point2D]) -> np.ndarray:
+        """Position of each point: 0 outside, 0.5 boundary, 1 inside"""
+        pass
+
     @abc.abstractmethod
     def _contains_jordan(jordan: JordanCurve, boundary: Optional[bool] = True):
         pass
@@ -787,6 +1055,8 @@ class SimpleShape(DefinedShape):
 
     """
 
+    __slots__ = ("__jordancurve", "__jordans", "__rectangle")
+
     def __init__(self, jordancurve: JordanCurve):
         assert isinstance(jordancurve, JordanCurve)
         super().__init__()
@@ -826,13 +1096,63 @@ class SimpleShape(DefinedShape):
     def __invert__(self) -> SimpleShape:
         return self.__class__(~self.jordans[0])
 
+    def __float__(self) -> float:
+        # The jordan curve stores its area until it's modified
+        return float(self.jordans[0].area)
+
     @property
     def jordans(self) -> Tuple[JordanCurve]:
-        return (self.__jordancurve,)
+        return self.__jordans
 
     def __set_jordancurve(self, other: JordanCurve):
         assert isinstance(other, JordanCurve)
         self.__jordancurve = copy(other)
+        self.__jordans = (self.__jordancurve,)
+        self.__rectangle = None
+
+    def __rectangle_box(self) -> Union[None, Tuple[float]]:
+        """
+        Gives (xmin, ymin, xmax, ymax) if the jordan curve is a rectangle
+        whose sides are parallel to the axis, or None otherwise.
+        Valid while the version of the jordan curve is the same
+        """
+        jordan = self.jordans[0]
+        if self.__rectangle is not None:
+            version, rectangle = self.__rectangle
+            if version == jordan.version:
+                return rectangle
+        rectangle = None
+        segments = jordan.segments
+        if len(segments) == 4 and all(seg.degree == 1 for seg in segments):
+            vectors = tuple(
+                seg.ctrlpoints[1] - seg.ctrlpoints[0] for seg in segments
+            )
+            horizontals = tuple(vec[1] == 0 != vec[0] for vec in vectors)
+            verticals = tuple(vec[0] == 0 != vec[1] for vec in vectors)
+            if (all(horizontals[::2]) and all(verticals[1::2])) or (
+                all(verticals[::2]) and all(horizontals[1::2])
+            ):
+                box = jordan.box()
+                rectangle = tuple(box.lowpt) + tuple(box.toppt)
+        self.__rectangle = (jordan.version, rectangle)
+        return rectangle
+
+    @staticmethod
+    def __rectangle_positions(
+        rectangle: Tuple[float], coords: np.ndarray
+    ) -> np.ndarray:
+        """
+        Positions of the points relative to the interior of the rectangle
+        0 if outside, 0.5 if on the boundary and 1 if inside
+        """
+        tolerance = 1e-6  # Same tolerance of PlanarCurve.__contains__
+        xmin, ymin, xmax, ymax = map(float, rectangle)
+        xvals, yvals = coords[:, 0], coords[:, 1]
+        outer = (xmin - tolerance <= xvals) & (xvals <= xmax + tolerance)
+        outer &= (ymin - tolerance <= yvals) & (yvals <= ymax + tolerance)
+        inner = (xmin + tolerance < xvals) & (xvals < xmax - tolerance)
+        inner &= (ymin + tolerance < yvals) & (yvals < ymax - tolerance)
+        return np.where(inner, 1.0, np.where(outer, 0.5, 0.0))
 
     def invert(self) -> SimpleShape:
         """
@@ -868,32 +1188,45 @@ class SimpleShape(DefinedShape):
     def _contains_point(
         self, point: Point2D, boundary: Optional[bool] = True
     ) -> bool:
+        # The arrays of the batch version are stored for each jordan
+        return bool(self._contains_points((point,), boundary)[0])
+
+    def _positions(self, points: Tuple[Point2D]) -> np.ndarray:
         jordan = self.jordans[0]
-        wind = IntegrateJordan.winding_number(jordan, center=point)
-        if float(jordan) > 0:
-            return wind > 0 if boundary else wind == 1
-        return wind > -1 if boundary else wind == 0
+        rectangle = self.__rectangle_box()
+        if rectangle is not None:
+            coords = chain.from_iterable(points)
+            coords = np.fromiter(coords, "float64", count=2 * len(points))
+            coords = coords.reshape(-1, 2)
+            positions = self.__rectangle_positions(rectangle, coords)
+            return positions if jordan.area > 0 else 1 - positions
+        winds = IntegrateJordan.winding_numbers(jordan, points)
+        return winds if jordan.area > 0 else winds + 1
 
     def _contains_jordan(
         self, jordan: JordanCurve, boundary: Optional[bool] = True
     ) -> bool:
-        for point in jordan.points(0):
-            if not self.contains_point(point, boundary):
+        # The jordan's box is tight only if all its segments are straight,
+        # a curved segment may stay inside while its control points don't
+        straight = all(segment.degree == 1 for segment in jordan.segments)
+        if straight and float(self) > 0:
+            box, mybox = jordan.box(), self.box()
+            if box.lowpt not in mybox or box.toppt not in mybox:
                 return False
+        if not np.all(self._contains_points(jordan.points(0), boundary)):
+            return False
         inters = jordan & self.jordans[0]
         uvals = {}
         for a, _, u, _ in inters:
             if a not in uvals:
                 uvals[a] = set()
             uvals[a].add(u)
+        points = []
         for a, us in uvals.items():
             us = sorted(us)
             umids = tuple((u0 + u1) / 2 for u0, u1 in zip(us[:-1], us[1:]))
-            points = jordan.segments[a].eval(umids)
-            for point in points:
-                if not self.contains_point(point, boundary):
-                    return False
-        return True
+            points += list(jordan.segments[a].eval(umids))
+        return bool(np.all(self._contains_points(points, boundary)))
 
     def _contains_shape(self, other: DefinedShape) -> bool:
         assert isinstance(other, DefinedShape)
@@ -947,6 +1280,8 @@ class ConnectedShape(DefinedShape):
 
     """
 
+    __slots__ = ("__subshapes", "__jordans")
+
     def __init__(self, subshapes: Tuple[SimpleShape]):
         super().__init__()
         self.subshapes = subshapes
@@ -980,7 +1315,7 @@ class ConnectedShape(DefinedShape):
         :getter: Returns a set of jordan curves
         :type: tuple[JordanCurve]
         """
-        return tuple(shape.jordans[0] for shape in self.subshapes)
+        return self.__jordans
 
     @property
     def subshapes(self) -> Tuple[SimpleShape]:
@@ -1022,15 +1357,22 @@ class ConnectedShape(DefinedShape):
         values = sorted(zip(areas, values), key=algori, reverse=True)
         values = tuple(val[1] for val in values)
         self.__subshapes = tuple(values)
+        self.__jordans = tuple(shape.jordans[0] for shape in self.__subshapes)
 
     def _contains_point(
         self, point: Point2D, boundary: Optional[bool] = True
     ) -> bool:
         for subshape in self.subshapes:
-            if not subshape.contains_point(point, boundary):
+            if not subshape._contains_point(point, boundary):
                 return False
         return True
 
+    def _positions(self, points: Tuple[Point2D]) -> np.ndarray:
+        positions = np.ones(len(points), dtype="float64")
+        for subshape in self.subshapes:
+            positions = np.minimum(positions, subshape._positions(points))
+        return positions
+
     def _contains_jordan(
         self, jordan: JordanCurve, boundary: Optional[bool] = True
     ) -> bool:
@@ -1054,10 +1396,12 @@ class DisjointShape(DefinedShape):
     ConnectedShape instances
     """
 
+    __slots__ = ("__subshapes", "__jordans", "__boxes", "__last_hit")
+
     def __new__(cls, subshapes: Tuple[ConnectedShape]):
-        subshapes = list(subshapes)
-        while EmptyShape() in subshapes:
-            subshapes.remove(EmptyShape())
+        subshapes = tuple(
+            sub for sub in subshapes if not isinstance(sub, EmptyShape)
+        )
         if len(subshapes) == 0:
             return EmptyShape()
         for subshape in subshapes:
@@ -1068,9 +1412,6 @@ class DisjointShape(DefinedShape):
         instance.subshapes = subshapes
         return instance
 
-    def __init__(self, subshapes: Tuple[ConnectedShape]):
-        super().__init__()
-
     def __float__(self) -> float:
         total = 0
         for subshape in self.subshapes:
@@ -1083,18 +1424,24 @@ class DisjointShape(DefinedShape):
             return False
         if float(self) != float(other):
             return False
-        self_subshapes = list(self.subshapes)
-        othe_subshapes = list(other.subshapes)
-        # Compare if a curve is inside another
-        while len(self_subshapes) and len(othe_subshapes):
-            for j, osbshape in enumerate(othe_subshapes):
-                if osbshape == self_subshapes[0]:
-                    self_subshapes.pop(0)
-                    othe_subshapes.pop(j)
+        if len(self.subshapes) != len(other.subshapes):
+            return False
+        # Equal subshapes have equal areas, so each subshape is compared
+        # only with the subshapes of other whose areas are close
+        othe_subshapes = sorted(other.subshapes, key=float)
+        othe_areas = tuple(map(float, othe_subshapes))
+        matched = [False] * len(othe_subshapes)
+        for subshape in self.subshapes:
+            area = float(subshape)
+            lower = bisect_left(othe_areas, area - 1e-6)
+            upper = bisect_right(othe_areas, area + 1e-6)
+            for j in range(lower, upper):
+                if not matched[j] and othe_subshapes[j] == subshape:
+                    matched[j] = True
                     break
             else:
                 return False
-        return not (len(self_subshapes) or len(othe_subshapes))
+        return True
 
     def __str__(self) -> str:
         msg = f"Disjoint shape with total area {float(self)} and "
@@ -1104,18 +1451,118 @@ class DisjointShape(DefinedShape):
     def __repr__(self) -> str:
         return self.__str__()
 
+    def __subshapes_boxes(self) -> Tuple[np.ndarray]:
+        """
+        Gives the array [(xmin, ymin, xmax, ymax), ...] with the boxes
+        of the subshapes, enlarged by the tolerance of ``Box``, sorted
+        by xmin, and the indexs of the subshapes of each line.
+        An unbounded subshape, like a hole, has an infinite box.
+        Valid while the subshapes' boxes are the same
+        """
+        boxes = tuple(subshape.box() for subshape in self.subshapes)
+        if self.__boxes is not None:
+            old_boxes, order, array = self.__boxes
+            if all(old is new for old, new in zip(old_boxes, boxes)):
+                return order, array
+        array = np.empty((len(boxes), 4), dtype="float64")
+        array[:, :2], array[:, 2:] = -np.inf, np.inf
+        for i, (subshape, box) in enumerate(zip(self.subshapes, boxes)):
+            if float(subshape) > 0:
+                array[i, 0] = box.lowpt[0] - box.dx
+                array[i, 1] = box.lowpt[1] - box.dy
+                array[i, 2] = box.toppt[0] + box.dx
+                array[i, 3] = box.toppt[1] + box.dy
+        order = np.argsort(array[:, 0], kind="stable")
+        array = array[order]
+        order.setflags(write=False)
+        array.setflags(write=False)
+        self.__boxes = (boxes, order, array)
+        return order, array
+
+    def __candidates(
+        self, lowpt: Tuple[float], toppt: Tuple[float]
+    ) -> Tuple[Union[SimpleShape, ConnectedShape]]:
+        """
+        Gives the subshapes whose box contains the rectangle with
+        corners ``lowpt`` and ``toppt``: only they can contain
+        an object which is inside this rectangle.
+        Since the boxes are sorted by xmin, only the ones which start
+        before the rectangle are verified
+        """
+        xmin, ymin = float(lowpt[0]), float(lowpt[1])
+        xmax, ymax = float(toppt[0]), float(toppt[1])
+        order, boxes = self.__subshapes_boxes()
+        stop = np.searchsorted(boxes[:, 0], xmin, side="right")
+        boxes = boxes[:stop]
+        mask = (xmax <= boxes[:, 2]) & (boxes[:, 1] <= ymin)
+        mask &= ymax <= boxes[:, 3]
+        indexs = np.sort(order[:stop][mask])
+        return tuple(self.subshapes[i] for i in indexs)
+
+    def __overlapping(
+        self, lowpt: Tuple[float], toppt: Tuple[float]
+    ) -> Tuple[Union[SimpleShape, ConnectedShape]]:
+        """
+        Gives the subshapes whose box overlaps the rectangle with
+        corners ``lowpt`` and ``toppt``. Since the boxes of the curves
+        come from their control points, a curve may be inside a subshape
+        while its box is not: only the subshapes far from the rectangle
+        are discarded
+        """
+        xmin, ymin = float(lowpt[0]), float(lowpt[1])
+        xmax, ymax = float(toppt[0]), float(toppt[1])
+        order, boxes = self.__subshapes_boxes()
+        stop = np.searchsorted(boxes[:, 0], xmax, side="right")
+        boxes = boxes[:stop]
+        mask = (xmin <= boxes[:, 2]) & (boxes[:, 1] <= ymax)
+        mask &= ymin <= boxes[:, 3]
+        indexs = np.sort(order[:stop][mask])
+        return tuple(self.subshapes[i] for i in indexs)
+
     def _contains_point(
         self, point: Point2D, boundary: Optional[bool] = True
     ) -> bool:
-        for subshape in self.subshapes:
-            if subshape.contains_point(point, boundary):
-                return True
-        return False
+        # The subshape of the last hit is tested first (move-to-front),
+        # since consecutive queries are usually close to each other
+        last_hit = self.__last_hit
+        candidates = sorted(
+            self.__candidates(point, point),
+            key=lambda sub: sub is not last_hit,
+        )
+        subshapes = (
+            sub for sub in candidates if sub._contains_point(point, boundary)
+        )
+        hit = next(subshapes, None)
+        if hit is None:
+            return False
+        self.__last_hit = hit
+        return True
+
+    def _positions(self, points: Tuple[Point2D]) -> np.ndarray:
+        # All the points are tested against all the packed boxes at once,
+        # then each subshape receives only the points inside its box
+        points = tuple(points)
+        coords = chain.from_iterable(points)
+        coords = np.fromiter(coords, "float64", count=2 * len(points))
+        xvals, yvals = coords.reshape(-1, 2).T[:, :, None]
+        order, boxes = self.__subshapes_boxes()
+        masks = (boxes[:, 0] <= xvals) & (xvals <= boxes[:, 2])
+        masks &= (boxes[:, 1] <= yvals) & (yvals <= boxes[:, 3])
+        positions = np.zeros(len(points), dtype="float64")
+        for index, mask in zip(order, masks.T):
+            indexs = np.flatnonzero(mask)
+            if len(indexs) == 0:
+                continue
+            subpoints = tuple(points[i] for i in indexs)
+            subpositions = self.subshapes[index]._positions(subpoints)
+            positions[indexs] = np.maximum(positions[indexs], subpositions)
+        return positions
 
     def _contains_jordan(
         self, jordan: JordanCurve, boundary: Optional[bool] = True
     ) -> bool:
-        for subshape in self.subshapes:
+        box = jordan.box()
+        for subshape in self.__overlapping(box.lowpt, box.toppt):
             if subshape.contains_jordan(jordan, boundary):
                 return True
         return False
@@ -1123,7 +1570,12 @@ class DisjointShape(DefinedShape):
     def _contains_shape(self, other: DefinedShape) -> bool:
         assert isinstance(other, DefinedShape)
         if isinstance(other, (SimpleShape, ConnectedShape)):
-            for subshape in self.subshapes:
+            # An unbounded shape is only inside an unbounded subshape
+            lowpt, toppt = (-np.inf, -np.inf), (np.inf, np.inf)
+            if float(other) > 0:
+                box = other.box()
+                lowpt, toppt = box.lowpt, box.toppt
+            for subshape in self.__overlapping(lowpt, toppt):
                 if other in subshape:
                     return True
             return False
@@ -1140,10 +1592,7 @@ class DisjointShape(DefinedShape):
         :getter: Returns a set of jordan curves
         :type: tuple[JordanCurve]
         """
-        lista = []
-        for subshape in self.subshapes:
-            lista += list(subshape.jordans)
-        return tuple(lista)
+        return self.__jordans
 
     @property
     def subshapes(self) -> Tuple[Union[SimpleShape, ConnectedShape]]:
@@ -1186,6 +1635,10 @@ class DisjointShape(DefinedShape):
         values = sorted(zip(areas, lenghts, values), key=algori, reverse=True)
         values = tuple(val[2] for val in values)
         self.__subshapes = tuple(values)
+        self.__boxes = None
+        self.__last_hit = None
+        jordans = (subshape.jordans for subshape in self.__subshapes)
+        self.__jordans = tuple(chain.from_iterable(jordans))
 
 
 def DivideConnecteds(
@@ -1204,14 +1657,14 @@ def DivideConnecteds(
     externals = []
     connected = []
     simples = list(simples)
+    # The areas are computed once, from the areas stored in the jordans
+    absareas = [abs(simple.jordans[0].area) for simple in simples]
     while len(simples):
-        areas = map(float, simples)
-        absareas = tuple(map(abs, areas))
         index = absareas.index(max(absareas))
         connected.append(simples.pop(index))
-        internal = []
-        while len(simples):  # Divide in two groups
-            simple = simples.pop(0)
+        absareas.pop(index)
+        internal, internal_areas = [], []
+        for simple, absarea in zip(simples, absareas):  # Divide in groups
             jordan = simple.jordans[0]
             for subsimple in connected:
                 subjordan = subsimple.jordans[0]
@@ -1220,7 +1673,8 @@ def DivideConnecteds(
                     break
             else:
                 internal.append(simple)
-        simples = internal
+                internal_areas.append(absarea)
+        simples, absareas = internal, internal_areas
     if len(connected) == 1:
         connected = connected[0]
     else:
@@ -1243,6 +1697,13 @@ def ShapeFromJordans(jordans: Tuple[JordanCurve]) -> BaseShape:
     simples = tuple(map(SimpleShape, jordans))
     if len(simples) == 1:
         return simples[0]
+    signs = 0  # Bit 1 for a counter-clockwise jordan, bit 2 for clockwise
+    for jordan in jordans:
+        signs |= 1 if jordan.area > 0 else 2
+    if signs == 1:  # Bounded regions, which are not inside each other
+        return DisjointShape(simples)
+    if signs == 2:  # Holes, which are not inside each other
+        return ConnectedShape(simples)
     connecteds = DivideConnecteds(simples)
     if len(connecteds) == 1:
         return connecteds[0]
@@ -88,6 +88,24 @@ class TestIntersectionSimple:
         assert square0 - square1 == left_shape
         assert square1 - square0 == right_shape
 
+    @pytest.mark.order(9)
+    @pytest.mark.timeout(40)
+    @pytest.mark.dependency(
+        depends=[
+            "TestIntersectionSimple::test_begin",
+            "TestIntersectionSimple::test_sub_two_rombos",
+        ]
+    )
+    def test_xor_two_rombos(self):
+        square0 = Primitive.regular_polygon(nsides=4, radius=2, center=(-1, 0))
+        square1 = Primitive.regular_polygon(nsides=4, radius=2, center=(1, 0))
+
+        test = square0 ^ square1
+        assert abs(float(test) - 12) < 1e-9
+        assert (-2, 0) in test
+        assert (2, 0) in test
+        assert (0, 0) not in test
+
     @pytest.mark.order(9)
     @pytest.mark.dependency(
         depends=[
@@ -95,6 +113,7 @@ class TestIntersectionSimple:
             "TestIntersectionSimple::test_or_two_rombos",
             "TestIntersectionSimple::test_and_two_rombos",
             "TestIntersectionSimple::test_sub_two_rombos",
+            "TestIntersectionSimple::test_xor_two_rombos",
         ]
     )
     def test_end(self):
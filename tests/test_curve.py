@@ -8,7 +8,13 @@ from fractions import Fraction
 import numpy as np
 import pytest
 
-from compmec.shape.curve import BezierCurve, IntegratePlanar, Math, PlanarCurve
+from compmec.shape.curve import (
+    BezierCurve,
+    IntegratePlanar,
+    Intersection,
+    Math,
+    PlanarCurve,
+)
 
 
 @pytest.mark.order(3)
@@ -104,6 +110,31 @@ class TestMath:
             "TestMath::test_bezier_carac_matrix",
         ]
     )
+    def test_bernstein_batch(self):
+        nodes = (0, 0.25, 0.5, 1)
+        test = Math.bernstein_batch(1, nodes)
+        good = [[1, 0], [0.75, 0.25], [0.5, 0.5], [0, 1]]
+        np.testing.assert_allclose(test, good)
+
+        test = Math.bernstein_batch(2, nodes)
+        good = [[16, 0, 0], [9, 6, 1], [4, 8, 4], [0, 0, 16]]
+        np.testing.assert_allclose(16 * test, good)
+
+        for degree in range(6):
+            test = Math.bernstein_batch(degree, np.linspace(0, 1, 9))
+            np.testing.assert_allclose(np.sum(test, axis=1), 1)
+
+    @pytest.mark.order(3)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(
+        depends=[
+            "TestMath::test_begin",
+            "TestMath::test_comb",
+            "TestMath::test_horner_method",
+            "TestMath::test_bezier_carac_matrix",
+            "TestMath::test_bernstein_batch",
+        ]
+    )
     def test_end(self):
         pass
 
@@ -244,6 +275,28 @@ class TestDerivate:
         dcurve = curve.derivate()
         assert id(dcurve) != id(curve)
 
+    @pytest.mark.order(3)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(
+        depends=[
+            "TestDerivate::test_begin",
+            "TestDerivate::test_planar_bezier",
+        ]
+    )
+    def test_stored_derivative(self):
+        points = [(0, 0), (1, 0), (0, 1)]
+        curve = PlanarCurve(points)
+        dcurve = curve.derivate()
+        assert curve.derivate() is dcurve
+        assert dcurve == PlanarCurve([(2, 0), (-2, 2)])
+
+        curve.ctrlpoints = [(0, 0), (2, 0), (0, 2)]
+        assert curve.derivate() is not dcurve
+        assert curve.derivate() == PlanarCurve([(4, 0), (-4, 4)])
+
+        curve.invert()
+        assert curve.derivate() == PlanarCurve([(4, -4), (-4, 0)])
+
     @pytest.mark.order(3)
     @pytest.mark.timeout(10)
     @pytest.mark.dependency(
@@ -251,6 +304,7 @@ class TestDerivate:
             "TestDerivate::test_begin",
             "TestDerivate::test_scalar_bezier",
             "TestDerivate::test_planar_bezier",
+            "TestDerivate::test_stored_derivative",
         ]
     )
     def test_end(self):
@@ -358,6 +412,30 @@ class TestIntegrate:
             "TestIntegrate::test_winding_regular_polygon",
         ]
     )
+    def test_moments(self):
+        points = [(1, 0), (2, 3), (0, 4)]
+        curve = PlanarCurve(points)
+        moments = IntegratePlanar.moments(curve, 3)
+        for expx in range(4):
+            for expy in range(4):
+                if expx + expy > 3:
+                    assert moments[expx][expy] == 0
+                    continue
+                good = IntegratePlanar.vertical(curve, expx, expy)
+                assert abs(moments[expx][expy] - good) < 1e-9
+
+    @pytest.mark.order(3)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(
+        depends=[
+            "TestIntegrate::test_begin",
+            "TestIntegrate::test_lenght",
+            "TestIntegrate::test_winding_triangles",
+            "TestIntegrate::test_winding_unit_circle",
+            "TestIntegrate::test_winding_regular_polygon",
+            "TestIntegrate::test_moments",
+        ]
+    )
     def test_end(self):
         pass
 
@@ -423,6 +501,107 @@ class TestOperations:
             "TestOperations::test_clean_quadratic",
         ]
     )
+    def test_clean_float(self):
+        points = [(0.0, 2.0), (1.0, 4.0), (2.0, 6.0)]
+        curve = PlanarCurve(points)
+        curve.clean()
+        assert curve.degree == 1
+        assert curve.ctrlpoints[0] == (0, 2)
+        assert curve.ctrlpoints[1] == (2, 6)
+
+        points = [(0.0, 0.0), (1.0, 1.0), (2.0, 0.0)]
+        curve = PlanarCurve(points)
+        curve.clean()
+        assert curve.degree == 2
+
+    @pytest.mark.order(3)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(
+        depends=[
+            "TestOperations::test_begin",
+            "TestOperations::test_clean_segment",
+            "TestOperations::test_clean_quadratic",
+            "TestOperations::test_clean_float",
+        ]
+    )
+    def test_intersect_float(self):
+        curvea = PlanarCurve([(0.0, 0.0), (1.0, 2.0), (2.0, 0.0)])
+        curveb = PlanarCurve([(0.0, 1.0), (1.0, -1.0), (2.0, 1.0)])
+        inters = curvea & curveb
+        assert len(inters) == 2
+        goods = ((2 - np.sqrt(2)) / 4, (2 + np.sqrt(2)) / 4)
+        for (ui, vi), good in zip(sorted(inters), goods):
+            assert abs(ui - good) < 1e-9
+            assert abs(vi - good) < 1e-9
+
+    @pytest.mark.order(3)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(
+        depends=[
+            "TestOperations::test_begin",
+            "TestOperations::test_clean_segment",
+            "TestOperations::test_clean_quadratic",
+            "TestOperations::test_clean_float",
+            "TestOperations::test_intersect_float",
+        ]
+    )
+    def test_intersect_linear(self):
+        curvea = PlanarCurve([(0, 0), (1, 1), (2, 2)])
+        curveb = PlanarCurve([(0, 2), (1, 1), (2, 0)])
+        assert Intersection.linearization_error(curvea) == 0
+        assert curvea & curveb == ((0.5, 0.5),)
+
+        curvec = PlanarCurve([(0, 0), (1, 2), (2, 0)])
+        assert Intersection.linearization_error(curvec) == 2
+
+    @pytest.mark.order(3)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(depends=["TestOperations::test_begin"])
+    def test_intersect_line_bezier(self):
+        line = PlanarCurve([(0.0, 0.5), (2.0, 0.5)])
+        curve = PlanarCurve([(0.0, 0.0), (1.0, 2.0), (2.0, 0.0)])
+        pairs = line & curve
+        goods = [(1 - 0.5**0.5) / 2, (1 + 0.5**0.5) / 2]
+        assert len(pairs) == 2
+        for (ui, vi), good in zip(sorted(pairs), goods):
+            assert abs(ui - good) < 1e-9
+            assert abs(vi - good) < 1e-9
+        pairs = curve & line
+        assert len(pairs) == 2
+        line = PlanarCurve([(0.0, 2.0), (2.0, 2.0)])
+        assert len(line & curve) == 0
+
+    @pytest.mark.order(3)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(depends=["TestOperations::test_begin"])
+    def test_intersect_implicit(self):
+        curvea = PlanarCurve([(0.0, 0.0), (1.0, 2.0), (2.0, 0.0)])
+        curveb = PlanarCurve([(0.0, 1.0), (1.0, -1.0), (2.0, 1.0)])
+        pairs = curvea & curveb
+        goods = [(1 - 0.5**0.5) / 2, (1 + 0.5**0.5) / 2]
+        assert len(pairs) == 2
+        for (ui, vi), good in zip(sorted(pairs), goods):
+            assert abs(ui - good) < 1e-9
+            assert abs(vi - good) < 1e-9
+        # Part of curvea, the implicit form is null over it
+        curveb = PlanarCurve([(0.0, 0.0), (0.5, 1.0), (1.0, 1.0)])
+        assert Intersection.implicit_and_bezier(curvea, curveb) is None
+        assert Intersection.implicit_and_bezier(curveb, curvea) is None
+
+    @pytest.mark.order(3)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(
+        depends=[
+            "TestOperations::test_begin",
+            "TestOperations::test_clean_segment",
+            "TestOperations::test_clean_quadratic",
+            "TestOperations::test_clean_float",
+            "TestOperations::test_intersect_float",
+            "TestOperations::test_intersect_linear",
+            "TestOperations::test_intersect_line_bezier",
+            "TestOperations::test_intersect_implicit",
+        ]
+    )
     def test_end(self):
         pass
 
@@ -3,6 +3,7 @@ This file contains tests functions to test the module polygon.py
 """
 
 import math
+from copy import copy
 
 import numpy as np
 import pytest
@@ -364,6 +365,46 @@ class TestTransformationPolygon:
             "TestTransformationPolygon::test_keep_ids",
         ]
     )
+    def test_stored_values(self):
+        square_vertices = [(0, 0), (1, 0), (1, 1), (0, 1)]
+        square = JordanCurve.from_vertices(square_vertices)
+        assert square.box() is square.box()
+        assert float(square) == 4
+        assert square.area == 1
+
+        square.move((2, 3))
+        assert square.box().lowpt == (2, 3)
+        assert square.box().toppt == (3, 4)
+
+        square.scale(2, 3)
+        assert square.box().lowpt == (4, 9)
+        assert square.box().toppt == (6, 12)
+        assert float(square) == 10
+        assert square.area == 6
+        assert (~square).area == -6
+
+        version = square.version
+        assert square.version == version
+        assert copy(square).version != version
+        square.move((1, 1))
+        assert square.version != version
+        version = square.version
+        square.split([0], [0.5])
+        assert square.version != version
+
+    @pytest.mark.order(4)
+    @pytest.mark.timeout(1)
+    @pytest.mark.dependency(
+        depends=[
+            "TestTransformationPolygon::test_move",
+            "TestTransformationPolygon::test_rotate",
+            "TestTransformationPolygon::test_scale",
+            "TestTransformationPolygon::test_invert",
+            "TestTransformationPolygon::test_split",
+            "TestTransformationPolygon::test_keep_ids",
+            "TestTransformationPolygon::test_stored_values",
+        ]
+    )
     def test_end(self):
         pass
 
@@ -398,6 +439,28 @@ class TestIntegrateJordan:
             wind = IntegrateJordan.winding_number(jordancurve)
             assert abs(wind + 1) < 1e-9
 
+    @pytest.mark.order(4)
+    @pytest.mark.timeout(10)
+    @pytest.mark.dependency(
+        depends=[
+            "TestIntegrateJordan::test_begin",
+            "TestIntegrateJordan::test_winding_regular_polygon",
+        ]
+    )
+    def test_winding_numbers(self):
+        vertices = [(0, 0), (4, 0), (4, 3), (0, 3)]
+        jordan = JordanCurve.from_vertices(vertices)
+        centers = [(1, 1), (5, 1), (0, 1), (4, 3), (-1, -1), (2, 2.9)]
+        goods = [1, 0, 0.5, 0.5, 0, 1]
+        tests = IntegrateJordan.winding_numbers(jordan, centers)
+        assert tests.shape == (len(centers),)
+        for center, test, good in zip(centers, tests, goods):
+            assert test == good
+            assert test == IntegrateJordan.winding_number(jordan, center)
+        tests = IntegrateJordan.winding_numbers(~jordan, centers)
+        for test, good in zip(tests, goods):
+            assert test == -good
+
     @pytest.mark.order(4)
     @pytest.mark.timeout(10)
     @pytest.mark.dependency(depends=["TestIntegrateJordan::test_begin"])
@@ -470,6 +533,7 @@ class TestIntegrateJordan:
         depends=[
             "TestIntegrateJordan::test_begin",
             "TestIntegrateJordan::test_winding_regular_polygon",
+            "TestIntegrateJordan::test_winding_numbers",
             "TestIntegrateJordan::test_lenght_triangle",
             "TestIntegrateJordan::test_lenght_square",
             "TestIntegrateJordan::test_lenght_regular_polygon",
@@ -529,6 +593,11 @@ class TestOthers:
         verticesb = [(-1, 0), (1, 0), (0, 1)]
         jordanb = JordanCurve.from_vertices(verticesb)
         assert jordana == jordanb
+        assert jordanb == jordana  # Uses the stored cleaned curves
+        jordana.move((1, 0))
+        assert jordana != jordanb
+        jordanb.move((1, 0))
+        assert jordana == jordanb
 
         verticesa = [(-1.0, 0.0), (0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
         jordana = JordanCurve.from_vertices(verticesa)
@@ -572,6 +641,34 @@ class TestOthers:
             "TestOthers::test_equal_divided",
         ]
     )
+    def test_parallel_intersection(self):
+        nsides = 40
+        angles = np.linspace(0, math.tau, nsides, endpoint=False)
+        vertices = tuple(zip(np.cos(angles), np.sin(angles)))
+        jordana = JordanCurve.from_vertices(vertices)
+        vertices = tuple((x + 0.5, y) for x, y in vertices)
+        jordanb = JordanCurve.from_vertices(vertices)
+        good = jordana.intersection(jordanb)
+        assert len(good) > 0
+        min_parallel_pairs = JordanCurve.min_parallel_pairs
+        try:
+            JordanCurve.min_parallel_pairs = 0
+            test = jordana.intersection(jordanb, n_jobs=2)
+        finally:
+            JordanCurve.min_parallel_pairs = min_parallel_pairs
+        assert test == good
+
+    @pytest.mark.order(4)
+    @pytest.mark.dependency(
+        depends=[
+            "TestOthers::test_begin",
+            "TestOthers::test_print",
+            "TestOthers::test_self_intersection",
+            "TestOthers::test_clean",
+            "TestOthers::test_equal_divided",
+            "TestOthers::test_parallel_intersection",
+        ]
+    )
     def test_end(self):
         pass
 
@@ -6,7 +6,7 @@ from fractions import Fraction as frac
 
 import pytest
 
-from compmec.shape.polygon import Point2D
+from compmec.shape.polygon import Box, Point2D
 
 
 @pytest.mark.order(2)
@@ -235,6 +235,35 @@ def test_print():
     print(type(pointb))
 
 
+@pytest.mark.order(2)
+@pytest.mark.timeout(10)
+@pytest.mark.dependency(
+    depends=[
+        "TestPoint::test_end",
+    ]
+)
+def test_overlapping_boxes():
+    boxesa = [
+        Box(Point2D(0, 0), Point2D(1, 1)),
+        Box(Point2D(2, 0), Point2D(3, 1)),
+        Box(Point2D(0, 5), Point2D(3, 6)),
+    ]
+    boxesb = [
+        Box(Point2D(frac(1, 2), frac(1, 2)), Point2D(frac(5, 2), 1)),
+        Box(Point2D(1, 0), Point2D(2, 1)),
+        Box(Point2D(-1, -1), Point2D(-frac(1, 2), 6)),
+    ]
+    good = tuple(
+        (i, j)
+        for i, boxa in enumerate(boxesa)
+        for j, boxb in enumerate(boxesb)
+        if boxa & boxb is not None
+    )
+    assert Box.overlapping_pairs(boxesa, boxesb) == good
+    assert good == ((0, 0), (0, 1), (1, 0), (1, 1))
+    assert Box.overlapping_pairs(boxesa, []) == tuple()
+
+
 @pytest.mark.order(2)
 @pytest.mark.dependency(
     depends=[
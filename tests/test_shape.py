@@ -7,7 +7,7 @@ import math
 
 import pytest
 
-from compmec.shape.jordancurve import JordanCurve
+from compmec.shape.jordancurve import IntegrateJordan, JordanCurve
 from compmec.shape.primitive import Primitive
 from compmec.shape.shape import EmptyShape, IntegrateShape, SimpleShape, WholeShape
 
@@ -157,12 +157,145 @@ class TestOthers:
         with pytest.raises(ValueError):
             shapea != 0
 
+    @pytest.mark.order(8)
+    @pytest.mark.dependency(
+        depends=[
+            "TestOthers::test_begin",
+        ]
+    )
+    def test_box(self):
+        square = Primitive.square(2)
+        box = square.box()
+        assert square.box() is box
+        assert tuple(box.lowpt) == (-1, -1)
+        assert tuple(box.toppt) == (1, 1)
+        square.move(1, 2)
+        box = square.box()
+        assert tuple(box.lowpt) == (0, 1)
+        assert tuple(box.toppt) == (2, 3)
+        square.scale(2, 1)
+        box = square.box()
+        assert tuple(box.lowpt) == (0, 1)
+        assert tuple(box.toppt) == (4, 3)
+
+    @pytest.mark.order(8)
+    @pytest.mark.dependency(
+        depends=[
+            "TestOthers::test_begin",
+        ]
+    )
+    def test_disjoint_contains(self):
+        left = Primitive.square(center=(-2, 0))
+        right = Primitive.square(center=(2, 0))
+        shape = left | right
+        assert (-2, 0) in shape
+        assert (2, 0) in shape
+        assert (0, 0) not in shape
+        assert shape.contains_point((2.5, 0))
+        assert not shape.contains_point((2.5, 0), False)
+        shape.move(0, 3)  # The boxes of the subshapes change
+        assert (2, 0) not in shape
+        assert (2, 3) in shape
+        inside = Primitive.square(side=0.5, center=(-2, 3))
+        assert inside in shape
+        assert inside.jordans[0] in shape
+        assert Primitive.square(center=(0, 3)) not in shape
+        assert ~inside not in shape
+        small = Primitive.square(side=1)
+        big = Primitive.square(side=3)
+        shape = small | (~big)  # With an unbounded subshape
+        assert (0, 0) in shape
+        assert (1, 0) not in shape
+        assert (10, 10) in shape
+        assert ~Primitive.square(side=5) in shape
+        assert Primitive.square(side=2) not in shape
+        shape = EmptyShape()
+        for i in range(10):  # Many subshapes in a row
+            shape |= Primitive.square(center=(3 * i, 0))
+        for i in range(10):
+            assert (3 * i, 0) in shape
+            assert (3 * i + 1.5, 0) not in shape
+            assert (3 * i, 1) not in shape
+
+    @pytest.mark.order(8)
+    @pytest.mark.dependency(
+        depends=[
+            "TestOthers::test_begin",
+            "TestOthers::test_disjoint_contains",
+        ]
+    )
+    def test_contains_points(self):
+        square = Primitive.square(2)
+        ring = square - Primitive.square(1)
+        pair = Primitive.square(center=(-2, 0)) | Primitive.square(center=(2, 0))
+        values = (-2.5, -2, -1, -0.5, -0.25, 0, 0.5, 1, 1.5, 2, 2.5)
+        points = [(xval, yval) for xval in values for yval in values]
+        for shape in (square, ring, pair, ~square):
+            for boundary in (True, False):
+                goods = [shape.contains_point(pt, boundary) for pt in points]
+                tests = shape.contains_points(points, boundary)
+                assert tests.tolist() == goods
+
+    @pytest.mark.order(8)
+    @pytest.mark.dependency(
+        depends=[
+            "TestOthers::test_begin",
+            "TestOthers::test_contains_points",
+        ]
+    )
+    def test_rectangle_contains(self):
+        rectangle = Primitive.square(1).scale(3, 2).move(1, 1)
+        values = (-1e-5, -1e-7, 0, 1e-7, 1e-5, 0.5, 1)
+        points = [(-0.5 + dx, 0 + dy) for dx in values for dy in values]
+        for shape in (rectangle, ~rectangle):
+            jordan = shape.jordans[0]
+            winds = IntegrateJordan.winding_numbers(jordan, points)
+            goods = winds > 0 if jordan.area > 0 else winds > -1
+            assert shape.contains_points(points).tolist() == goods.tolist()
+            for point, good in zip(points, goods):
+                assert shape.contains_point(point) == good
+        assert (2.4, 1.9) in rectangle
+        rectangle.move(1, 0)  # The jordan changes its version
+        assert (2.4, 1.9) in rectangle
+        assert (-0.4, 0.1) not in rectangle
+
+    @pytest.mark.order(8)
+    @pytest.mark.dependency(
+        depends=[
+            "TestOthers::test_begin",
+            "TestOthers::test_box",
+        ]
+    )
+    def test_curved_contains(self):
+        # The top segment stays below y = 0.95, but its control point
+        # (0, 1.4) is outside the square's box
+        all_ctrlpoints = [
+            [(-0.5, -0.5), (0.5, -0.5)],
+            [(0.5, -0.5), (0.5, 0.5)],
+            [(0.5, 0.5), (0.0, 1.4), (-0.5, 0.5)],
+            [(-0.5, 0.5), (-0.5, -0.5)],
+        ]
+        jordan = JordanCurve.from_ctrlpoints(all_ctrlpoints)
+        square = Primitive.square(2)
+        assert jordan in square
+        assert SimpleShape(jordan) in square
+        assert jordan not in Primitive.square(1.5)
+        shape = square | Primitive.square(2, center=(5, 0))
+        assert jordan in shape
+        assert SimpleShape(jordan) in shape
+        assert jordan not in Primitive.square(1.5) | shape.subshapes[1]
+
     @pytest.mark.order(8)
     @pytest.mark.dependency(
         depends=[
             "TestOthers::test_begin",
             "TestOthers::test_print",
             "TestOthers::test_compare",
+            "TestOthers::test_box",
+            "TestOthers::test_disjoint_contains",
+            "TestOthers::test_contains_points",
+            "TestOthers::test_rectangle_contains",
+            "TestOthers::test_curved_contains",
         ]
     )
     def test_end(self):